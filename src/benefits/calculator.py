@@ -212,8 +212,9 @@ def _get_confidence_factor(project_name: str, risk_report: PortfolioRiskReport |
     if risk_report is None:
         return 0.8  # Conservative default
 
+    name_lower = project_name.lower()
     for s in risk_report.project_summaries:
-        if s.project_name.lower() == project_name.lower():
+        if s.name_lower == name_lower:
             # Base from RAG
             rag_base = {"Red": 0.5, "Amber": 0.7, "Green": 0.9}.get(s.rag_status, 0.8)
 
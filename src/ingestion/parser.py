@@ -11,12 +11,22 @@ from __future__ import annotations
 
 import csv
 import json
+import os
+import sys
 from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional speed-up; fall back to the stdlib json module
+    orjson = None
+
 
 @dataclass
 class Task:
@@ -30,6 +40,21 @@ class Task:
     previous_sprints: list[str] = field(default_factory=list)
     comments: str = ""
 
+    @cached_property
+    def status_norm(self) -> str:
+        """Stripped, lowercase status, interned so detector table lookups can match on identity."""
+        return sys.intern(self.status.strip().lower())
+
+    @cached_property
+    def priority_norm(self) -> str:
+        """Stripped, lowercase priority, interned like status_norm."""
+        return sys.intern(self.priority.strip().lower())
+
+    @cached_property
+    def comments_lower(self) -> str:
+        """Lowercase comments, computed once for case-insensitive keyword scans."""
+        return self.comments.lower()
+
 
 @dataclass
 class Project:
@@ -43,6 +68,21 @@ class Project:
     actual_spend: float = 0.0
     tasks: list[Task] = field(default_factory=list)
 
+    @cached_property
+    def name_lower(self) -> str:
+        """Lowercase project name, computed once for case-insensitive matching."""
+        return self.name.lower()
+
+    @cached_property
+    def start_ord(self) -> int | None:
+        """Proleptic ordinal of start_date, for integer day arithmetic."""
+        return self.start_date.toordinal() if self.start_date is not None else None
+
+    @cached_property
+    def end_ord(self) -> int | None:
+        """Proleptic ordinal of end_date, for integer day arithmetic."""
+        return self.end_date.toordinal() if self.end_date is not None else None
+
 
 # ──────────────────────────────────────────────
 # Column name mapping — normalise variations
@@ -124,10 +164,30 @@ COLUMN_ALIASES: dict[str, str] = {
 }
 
 # Minimum required columns (by internal field name)
-REQUIRED_FIELDS = {"project", "task_name", "task_status"}
+REQUIRED_FIELDS = frozenset({"project", "task_name", "task_status"})
 
 # Supported file extensions
-SUPPORTED_EXTENSIONS = {".csv", ".json", ".xlsx", ".xls"}
+SUPPORTED_EXTENSIONS = frozenset({".csv", ".json", ".xlsx", ".xls"})
+
+# Internal fields read from each row, in the order _rows_to_projects unpacks them
+ROW_FIELDS = (
+    "project",
+    "project_status",
+    "start_date",
+    "end_date",
+    "budget",
+    "actual_spend",
+    "task_name",
+    "task_status",
+    "priority",
+    "assignee",
+    "sprint",
+    "previous_sprints",
+    "comments",
+)
+
+# Read buffer for regular CSV reads (fewer syscalls on network drives)
+CSV_READ_BUFFER_BYTES = 1 << 20
 
 # Date formats to try when parsing date strings
 DATE_FORMATS = [
@@ -142,6 +202,16 @@ DATE_FORMATS = [
     "%B %d, %Y",      # January 15, 2026
 ]
 
+# Placeholder values seen in Jira/ADO date columns that mean "no date"
+_DATE_SENTINELS = frozenset({"none", "null", "n/a", "tbd", "tbc", "unknown"})
+
+# Length bounds for strings DATE_FORMATS can match. The shortest is "1/1/2026" (8).
+# The longest canonical form is "September 30, 2026" (18), but strptime matches
+# a space in the format against any run of whitespace, so exports with padded
+# fields ("September  30,  2026") still parse; the upper bound leaves room for that.
+_MIN_DATE_LEN = 8
+_MAX_DATE_LEN = 24
+
 
 # ──────────────────────────────────────────────
 # Public API
@@ -188,6 +258,39 @@ def parse_file(filepath: str | Path) -> list[Project]:
     raise ValueError(f"Unsupported file format: '{ext}'")
 
 
+def parse_files(filepaths: Iterable[str | Path], max_workers: int | None = None) -> list[Project]:
+    """Parse several export files in parallel and return all their projects.
+
+    Each file is parsed by parse_file() in a separate worker process, so
+    multi-file ingests (e.g. one export per team) scale across CPU cores.
+    A single file is parsed in-process to avoid pool start-up cost.
+
+    Args:
+        filepaths: Paths to the export files.
+        max_workers: Maximum worker processes (defaults to the CPU count).
+
+    Returns:
+        Combined list of Project objects from all files, sorted by project name.
+
+    Raises:
+        ValueError: If any file format is unsupported or required columns are missing.
+        FileNotFoundError: If any file does not exist.
+    """
+    paths = [Path(fp) for fp in filepaths]
+    if not paths:
+        return []
+
+    if len(paths) == 1:
+        results = [parse_file(paths[0])]
+    else:
+        workers = min(len(paths), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(parse_file, paths))
+
+    projects = [project for file_projects in results for project in file_projects]
+    return sorted(projects, key=lambda p: p.name)
+
+
 # ──────────────────────────────────────────────
 # CSV Parser
 # ──────────────────────────────────────────────
@@ -208,7 +311,7 @@ def _parse_csv(filepath: Path) -> list[Project]:
     Raises:
         ValueError: If required columns are missing or file is empty.
     """
-    with open(filepath, newline="", encoding="utf-8-sig") as f:
+    with open(filepath, newline="", encoding="utf-8-sig", buffering=CSV_READ_BUFFER_BYTES) as f:
         reader = csv.DictReader(f)
 
         if reader.fieldnames is None:
@@ -248,8 +351,7 @@ def _parse_json(filepath: Path) -> list[Project]:
     Raises:
         ValueError: If JSON structure is unrecognised or required columns are missing.
     """
-    with open(filepath, encoding="utf-8-sig") as f:
-        data = json.load(f)
+    data = load_json(filepath)
 
     # Determine structure and extract flat row list
     rows: list[dict[str, Any]]
@@ -298,6 +400,23 @@ def _parse_json(filepath: Path) -> list[Project]:
     return _rows_to_projects(str_rows, col_map)
 
 
+def load_json(filepath: Path) -> Any:
+    """Load a JSON file, using orjson when it is installed.
+
+    Any UTF-8 BOM is stripped. orjson is strict RFC 8259, so input it
+    rejects (e.g. the NaN that pandas writes for empty cells) is retried
+    with the stdlib parser, which accepts it. Genuinely malformed files
+    raise json.JSONDecodeError either way.
+    """
+    raw = filepath.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw[3:] if raw.startswith(b"\xef\xbb\xbf") else raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8-sig"))
+
+
 def _flatten_nested_projects(projects: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Flatten nested project structure into flat rows.
 
@@ -337,6 +456,26 @@ def _stringify_row(row: dict[str, Any]) -> dict[str, str]:
     return result
 
 
+# openpyxl is only needed for Excel files, so it is imported on first use
+_openpyxl: Any = None
+
+
+def load_openpyxl() -> Any:
+    """Import openpyxl on first call and cache the module.
+
+    Returns:
+        The openpyxl module, or None if it is not installed.
+    """
+    global _openpyxl
+    if _openpyxl is None:
+        try:
+            import openpyxl
+        except ImportError:
+            return None
+        _openpyxl = openpyxl
+    return _openpyxl
+
+
 def _parse_xlsx(filepath: Path) -> list[Project]:
     """Parse an Excel export file into Project objects.
 
@@ -351,9 +490,8 @@ def _parse_xlsx(filepath: Path) -> list[Project]:
     Raises:
         ValueError: If required columns are missing or sheet is empty.
     """
-    try:
-        import openpyxl
-    except ImportError:
+    openpyxl = load_openpyxl()
+    if openpyxl is None:
         raise ImportError(
             "openpyxl is required to parse Excel files. "
             "Install it with: pip install openpyxl"
@@ -460,13 +598,18 @@ def _rows_to_projects(rows: list[dict[str, str]], col_map: dict[str, str]) -> li
     if not rows:
         return []
 
-    # Reverse map: internal field name -> original column name
+    # Resolve each internal field to its original column name once, up front
     field_to_col: dict[str, str] = {v: k for k, v in col_map.items()}
+    (
+        project_col, project_status_col, start_date_col, end_date_col, budget_col,
+        actual_spend_col, task_name_col, task_status_col, priority_col, assignee_col,
+        sprint_col, previous_sprints_col, comments_col,
+    ) = (field_to_col.get(f) for f in ROW_FIELDS)
 
     # Group rows by project
     project_rows: dict[str, list[dict[str, str]]] = defaultdict(list)
     for row in rows:
-        project_name = _get_field(row, field_to_col, "project", "").strip()
+        project_name = _get_field_or_empty(row, project_col)
         if project_name:
             project_rows[project_name].append(row)
 
@@ -477,24 +620,24 @@ def _rows_to_projects(rows: list[dict[str, str]], col_map: dict[str, str]) -> li
 
         project = Project(
             name=project_name,
-            status=_get_field(first_row, field_to_col, "project_status", "Unknown"),
-            start_date=_parse_date(_get_field(first_row, field_to_col, "start_date", "")),
-            end_date=_parse_date(_get_field(first_row, field_to_col, "end_date", "")),
-            budget=_parse_float(_get_field(first_row, field_to_col, "budget", "0")),
-            actual_spend=_parse_float(_get_field(first_row, field_to_col, "actual_spend", "0")),
+            status=_get_field(first_row, project_status_col, "Unknown"),
+            start_date=_parse_date(_get_field_or_empty(first_row, start_date_col)),
+            end_date=_parse_date(_get_field_or_empty(first_row, end_date_col)),
+            budget=_parse_float(_get_field(first_row, budget_col, "0")),
+            actual_spend=_parse_float(_get_field(first_row, actual_spend_col, "0")),
         )
 
         for row in p_rows:
             task = Task(
-                name=_get_field(row, field_to_col, "task_name", ""),
-                status=_get_field(row, field_to_col, "task_status", ""),
-                priority=_get_field(row, field_to_col, "priority", "Medium"),
-                assignee=_get_field(row, field_to_col, "assignee", ""),
-                sprint=_get_field(row, field_to_col, "sprint", ""),
+                name=_get_field_or_empty(row, task_name_col),
+                status=_get_field_or_empty(row, task_status_col),
+                priority=_get_field(row, priority_col, "Medium"),
+                assignee=_get_field_or_empty(row, assignee_col),
+                sprint=_get_field_or_empty(row, sprint_col),
                 previous_sprints=_parse_sprint_history(
-                    _get_field(row, field_to_col, "previous_sprints", "")
+                    _get_field_or_empty(row, previous_sprints_col)
                 ),
-                comments=_get_field(row, field_to_col, "comments", ""),
+                comments=_get_field_or_empty(row, comments_col),
             )
             if task.name:  # Skip rows with no task name
                 project.tasks.append(task)
@@ -504,25 +647,31 @@ def _rows_to_projects(rows: list[dict[str, str]], col_map: dict[str, str]) -> li
     return sorted(projects, key=lambda p: p.name)
 
 
-def _get_field(row: dict[str, str], field_to_col: dict[str, str], field_name: str, default: str) -> str:
-    """Safely extract a field value from a row using the column mapping.
+def _get_field(row: dict[str, str], col_name: str | None, default: str) -> str:
+    """Safely extract a field value from a row.
 
     Args:
         row: Dict of column_name -> value.
-        field_to_col: Dict of internal_field_name -> original_column_name.
-        field_name: Internal field name to look up.
+        col_name: Original column name for the field, or None if unmapped.
         default: Default value if field not found or empty.
 
     Returns:
         The field value as a string, or the default.
     """
-    col_name = field_to_col.get(field_name)
     if col_name is None:
         return default
     value = row.get(col_name, "").strip()
     return value if value else default
 
 
+def _get_field_or_empty(row: dict[str, str], col_name: str | None) -> str:
+    """Extract a stripped field value, or "" if unmapped.
+
+    Fast path for fields whose default is the empty string.
+    """
+    return row.get(col_name, "").strip() if col_name is not None else ""
+
+
 # ──────────────────────────────────────────────
 # Value parsers
 # ──────────────────────────────────────────────
@@ -540,11 +689,16 @@ def _parse_date(value: str) -> date | None:
     Returns:
         A date object, or None if parsing fails.
     """
-    if not value or not value.strip():
+    if not value:
         return None
 
     value = value.strip()
 
+    # Reject common "no date" placeholders and impossible lengths without
+    # running the strptime loop
+    if not _MIN_DATE_LEN <= len(value) <= _MAX_DATE_LEN or value.lower() in _DATE_SENTINELS:
+        return None
+
     for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(value, fmt).date()
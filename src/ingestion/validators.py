@@ -16,7 +16,14 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from src.ingestion.parser import COLUMN_ALIASES, REQUIRED_FIELDS, SUPPORTED_EXTENSIONS
+from src.ingestion.parser import (
+    COLUMN_ALIASES,
+    CSV_READ_BUFFER_BYTES,
+    REQUIRED_FIELDS,
+    SUPPORTED_EXTENSIONS,
+    load_json,
+    load_openpyxl,
+)
 
 
 @dataclass
@@ -45,7 +52,7 @@ class ValidationResult:
 
 
 # Optional columns we expect to see for full functionality
-OPTIONAL_FIELDS = {
+OPTIONAL_FIELDS = frozenset({
     "project_status",
     "start_date",
     "end_date",
@@ -56,7 +63,11 @@ OPTIONAL_FIELDS = {
     "sprint",
     "previous_sprints",
     "comments",
-}
+})
+
+# Optional fields grouped by importance, for missing-column warnings
+_HIGH_VALUE = frozenset({"budget", "actual_spend", "start_date", "end_date"})
+_MEDIUM_VALUE = frozenset({"priority", "sprint", "previous_sprints", "comments"})
 
 
 def validate_file(filepath: str | Path) -> ValidationResult:
@@ -117,7 +128,7 @@ def validate_file(filepath: str | Path) -> ValidationResult:
 def _validate_csv(filepath: Path, result: ValidationResult) -> None:
     """Validate a CSV file's structure and columns."""
     try:
-        with open(filepath, newline="", encoding="utf-8-sig") as f:
+        with open(filepath, newline="", encoding="utf-8-sig", buffering=CSV_READ_BUFFER_BYTES) as f:
             reader = csv.DictReader(f)
 
             if reader.fieldnames is None:
@@ -138,9 +149,8 @@ def _validate_csv(filepath: Path, result: ValidationResult) -> None:
             # Check optional
             _check_optional(col_map, result)
 
-            # Count rows
-            rows = list(reader)
-            result.row_count = len(rows)
+            # Count rows (streamed — rows are not retained)
+            result.row_count = sum(1 for _ in reader)
 
             if result.row_count == 0:
                 result.warnings.append("File has headers but no data rows.")
@@ -156,8 +166,7 @@ def _validate_csv(filepath: Path, result: ValidationResult) -> None:
 def _validate_json(filepath: Path, result: ValidationResult) -> None:
     """Validate a JSON file's structure and columns."""
     try:
-        with open(filepath, encoding="utf-8-sig") as f:
-            data = json.load(f)
+        data = load_json(filepath)
     except json.JSONDecodeError as e:
         result.valid = False
         result.errors.append(f"Invalid JSON: {e}")
@@ -223,9 +232,8 @@ def _validate_json(filepath: Path, result: ValidationResult) -> None:
 
 def _validate_xlsx(filepath: Path, result: ValidationResult) -> None:
     """Validate an Excel file's structure and columns."""
-    try:
-        import openpyxl
-    except ImportError:
+    openpyxl = load_openpyxl()
+    if openpyxl is None:
         result.valid = False
         result.errors.append("openpyxl is required to validate Excel files. pip install openpyxl")
         return
@@ -244,16 +252,21 @@ def _validate_xlsx(filepath: Path, result: ValidationResult) -> None:
         result.errors.append("Excel file has no active sheet.")
         return
 
-    all_rows = list(ws.iter_rows(values_only=True))
-    wb.close()
+    # Stream rows: only the header is kept, data rows are just counted
+    try:
+        rows_iter = ws.iter_rows(values_only=True)
+        header_row = next(rows_iter, None)
+        data_row_count = sum(1 for _ in rows_iter)
+    finally:
+        wb.close()
 
-    if not all_rows:
+    if header_row is None:
         result.valid = False
         result.errors.append("Excel file has no rows.")
         return
 
     # First row is headers
-    headers = [str(h).strip() if h is not None else "" for h in all_rows[0]]
+    headers = [str(h).strip() if h is not None else "" for h in header_row]
     headers = [h for h in headers if h]  # Remove empty headers
     result.columns_found = headers
 
@@ -267,7 +280,7 @@ def _validate_xlsx(filepath: Path, result: ValidationResult) -> None:
     _check_required(col_map, result)
     _check_optional(col_map, result)
 
-    result.row_count = len(all_rows) - 1  # Exclude header row
+    result.row_count = data_row_count
 
     if result.row_count == 0:
         result.warnings.append("Excel file has headers but no data rows.")
@@ -310,13 +323,8 @@ def _check_optional(col_map: dict[str, str], result: ValidationResult) -> None:
     mapped_fields = set(col_map.keys())
     missing_optional = OPTIONAL_FIELDS - mapped_fields
 
-    # Group warnings by importance
-    high_value = {"budget", "actual_spend", "start_date", "end_date"}
-    medium_value = {"priority", "sprint", "previous_sprints", "comments"}
-    low_value = {"project_status", "assignee"}
-
-    missing_high = missing_optional & high_value
-    missing_medium = missing_optional & medium_value
+    missing_high = missing_optional & _HIGH_VALUE
+    missing_medium = missing_optional & _MEDIUM_VALUE
 
     if missing_high:
         result.warnings.append(
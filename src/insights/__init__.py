@@ -10,9 +10,24 @@ Sprint 7 enhancement.
 
 from __future__ import annotations
 
-from src.risk_engine.engine import PortfolioRiskReport, RiskCategory, RiskSeverity
+import heapq
+import re
+from itertools import chain
+from operator import itemgetter
+
 from src.benefits.calculator import PortfolioBenefitReport
-from src.investment import PortfolioInvestmentReport, InvestmentAction
+from src.investment import InvestmentAction, PortfolioInvestmentReport
+from src.risk_engine.engine import PortfolioRiskReport, ProjectRiskSummary, RiskCategory, RiskSeverity
+
+# Project-name keywords that flag compliance / regulatory work
+COMPLIANCE_KEYWORDS = ("compliance", "regulatory", "audit", "cyber", "security")
+_COMPLIANCE_RE = re.compile("|".join(map(re.escape, COMPLIANCE_KEYWORDS)), re.IGNORECASE)
+
+# RAG statuses that warrant escalating compliance projects
+_ESCALATION_RAGS = frozenset({"Red", "Amber"})
+
+# Blocked-work severities that can cascade into dependent projects
+_BLOCKING_SEVERITIES = frozenset({RiskSeverity.CRITICAL, RiskSeverity.HIGH})
 
 
 def generate_executive_summary(
@@ -24,44 +39,81 @@ def generate_executive_summary(
 
     urgent_items: list[tuple[int, str]] = []  # (priority, text)
 
-    total = len(risk_report.project_summaries)
-    reds = [s for s in risk_report.project_summaries if s.rag_status == "Red"]
-    ambers = [s for s in risk_report.project_summaries if s.rag_status == "Amber"]
-
-    # 1. Budget-critical projects
-    for s in risk_report.project_summaries:
+    summaries = risk_report.project_summaries
+    total = len(summaries)
+    red_count = 0
+    amber_count = 0
+    blocked_projects: set[str] = set()
+    on_hold: list[ProjectRiskSummary] = []
+
+    # Single pass: RAG counts, budget-critical (1), compliance (2),
+    # blocked-project collection (3) and on-hold projects (6)
+    for s in summaries:
+        rag = s.rag_status
+        if rag == "Red":
+            red_count += 1
+        elif rag == "Amber":
+            amber_count += 1
+
+        budget_critical = False
+        critical_count = 0
         for r in s.risks:
-            if r.category == RiskCategory.BURN_RATE and r.severity == RiskSeverity.CRITICAL:
-                urgent_items.append((1, f"{s.project_name} will exhaust its budget before delivery completes — approve a top-up or cut scope"))
-                break
-
-    # 2. Compliance / regulatory deadlines
-    for s in risk_report.project_summaries:
-        name_lower = s.project_name.lower()
-        if any(kw in name_lower for kw in ("compliance", "regulatory", "audit", "cyber", "security")):
-            if s.rag_status in ("Red", "Amber"):
-                critical_count = sum(1 for r in s.risks if r.severity == RiskSeverity.CRITICAL)
-                if critical_count > 0:
-                    urgent_items.append((2, f"{s.project_name} has {critical_count} critical issues and may miss its regulatory deadline"))
+            if r.severity == RiskSeverity.CRITICAL:
+                critical_count += 1
+                if r.category == RiskCategory.BURN_RATE:
+                    budget_critical = True
+            if r.category == RiskCategory.BLOCKED_WORK and r.severity in _BLOCKING_SEVERITIES:
+                blocked_projects.add(s.project_name)
+
+        # 1. Budget-critical projects
+        if budget_critical:
+            urgent_items.append((
+                1,
+                f"{s.project_name} will exhaust its budget before delivery completes — approve a top-up or cut scope",
+            ))
+
+        # 2. Compliance / regulatory deadlines
+        if critical_count > 0 and rag in _ESCALATION_RAGS and _COMPLIANCE_RE.search(s.project_name):
+            urgent_items.append((
+                2,
+                f"{s.project_name} has {critical_count} critical issues and may miss its regulatory deadline",
+            ))
+
+        if "hold" in s.project_status.lower():
+            on_hold.append(s)
 
     # 3. Blocked cascades — projects blocking other projects
-    blocked_projects = set()
-    for s in risk_report.project_summaries:
-        for r in s.risks:
-            if r.category == RiskCategory.BLOCKED_WORK and r.severity in (RiskSeverity.CRITICAL, RiskSeverity.HIGH):
-                blocked_projects.add(s.project_name)
-    for s in risk_report.project_summaries:
-        for r in s.risks:
-            if r.category == RiskCategory.DEPENDENCY:
-                for bp in blocked_projects:
-                    if bp.lower().split(" - ")[0] in r.explanation.lower():
-                        urgent_items.append((3, f"blockers in {bp} are cascading into dependent projects"))
+    if blocked_projects:
+        # One alternation over every blocker's name prefix, so each explanation
+        # is scanned once rather than once per blocked project
+        prefix_owner: dict[str, str] = {}
+        for bp in blocked_projects:
+            prefix_owner.setdefault(bp.lower().split(" - ", 1)[0], bp)
+        blocked_re = re.compile("|".join(
+            re.escape(prefix) for prefix in sorted(prefix_owner, key=len, reverse=True)
+        ))
+        # Report each blocker once; stop scanning when every blocker has cascaded
+        cascaded: set[str] = set()
+        for r in chain.from_iterable(s.risks for s in summaries):
+            if r.category != RiskCategory.DEPENDENCY:
+                continue
+            m = blocked_re.search(r.explanation.lower())
+            if m:
+                bp = prefix_owner[m.group()]
+                if bp not in cascaded:
+                    cascaded.add(bp)
+                    urgent_items.append((3, f"blockers in {bp} are cascading into dependent projects"))
+                    if len(cascaded) == len(prefix_owner):
                         break
 
     # 4. Benefits drift
     if benefit_report and benefit_report.portfolio_drift_pct > 0.20:
         at_risk_value = benefit_report.total_at_risk_value
-        urgent_items.append((4, f"benefits are drifting {benefit_report.portfolio_drift_pct:.0%} from plan — £{at_risk_value:,.0f} of portfolio value at risk"))
+        urgent_items.append((
+            4,
+            f"benefits are drifting {benefit_report.portfolio_drift_pct:.0%} from plan — "
+            f"£{at_risk_value:,.0f} of portfolio value at risk",
+        ))
 
     # 5. Projects recommended for divestment
     if investment_report:
@@ -69,33 +121,28 @@ def generate_executive_summary(
         if divests:
             freed = sum(p.cost_to_complete for p in divests)
             names = ", ".join(p.project_name for p in divests[:2])
-            urgent_items.append((5, f"{names} showing negative ROI — recommend stopping discretionary spend, freeing £{freed:,.0f} for reallocation"))
+            urgent_items.append((
+                5,
+                f"{names} showing negative ROI — recommend stopping discretionary spend, "
+                f"freeing £{freed:,.0f} for reallocation",
+            ))
 
     # 6. On-hold / stalled projects burning time
-    on_hold = [s for s in risk_report.project_summaries if "hold" in s.project_status.lower() or "on hold" in s.project_status.lower()]
     if on_hold:
         names = ", ".join(s.project_name for s in on_hold[:2])
         urgent_items.append((6, f"{names} stalled — confirm go/no-go to release committed resources"))
 
-    # Deduplicate by project name (keep highest priority)
-    seen_projects: set[str] = set()
-    deduped: list[tuple[int, str]] = []
-    for priority, text in sorted(urgent_items, key=lambda x: x[0]):
-        # Extract first project name mentioned
-        key = text.split(" ")[0] if text else ""
-        if key not in seen_projects or len(deduped) < 3:
-            deduped.append((priority, text))
-            seen_projects.add(key)
+    # Top 3 by priority (stable, so ties keep discovery order)
+    top = heapq.nsmallest(3, urgent_items, key=itemgetter(0))
 
     # Build the paragraph
-    if not deduped:
+    if not top:
         return (
             f"The portfolio is tracking {total} active projects with "
-            f"{len(reds)} at Red status and {len(ambers)} at Amber. "
+            f"{red_count} at Red status and {amber_count} at Amber. "
             f"No critical escalation needed this cycle — continue standard monitoring."
         )
 
-    top = deduped[:3]
     numbered = "; ".join(f"({i+1}) {text}" for i, (_, text) in enumerate(top))
 
     # Determine urgency level
@@ -11,12 +11,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date
+from functools import cached_property
 from typing import Any
 from enum import Enum
 
+import numpy as np
+
 from src.ingestion.parser import Project
-from src.risk_engine.engine import PortfolioRiskReport, RiskSeverity
-from src.benefits.calculator import PortfolioBenefitReport
+from src.risk_engine.engine import PortfolioRiskReport, ProjectRiskSummary, RiskSeverity
+from src.benefits.calculator import PortfolioBenefitReport, ProjectBenefitSummary
 
 
 class InvestmentAction(Enum):
@@ -26,6 +29,10 @@ class InvestmentAction(Enum):
     REVIEW = "Review"
 
 
+# Benefit realisation multiplier by RAG, used when no benefit report is supplied
+_RAG_MULTIPLIER: dict[str, float] = {"Red": 0.5, "Amber": 0.7, "Green": 0.9}
+
+
 @dataclass
 class ProjectInvestment:
     """Investment analysis for a single project."""
@@ -44,6 +51,21 @@ class ProjectInvestment:
     action: InvestmentAction
     action_rationale: str
 
+    @cached_property
+    def budget_str(self) -> str:
+        """Budget formatted for display, e.g. '£250,000'."""
+        return f"£{self.budget:,.0f}"
+
+    @cached_property
+    def roi_str(self) -> str:
+        """ROI formatted as a whole percentage, e.g. '42%'."""
+        return f"{self.roi:.0%}"
+
+    @property
+    def rank_str(self) -> str:
+        """ROI rank as text (not cached — rank is assigned after construction)."""
+        return str(self.roi_rank)
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "project_name": self.project_name,
@@ -100,11 +122,49 @@ def analyse_investments(
 ) -> PortfolioInvestmentReport:
     """Run full portfolio investment analysis."""
 
-    project_investments: list[ProjectInvestment] = []
+    # Index summaries by lowercase project name once (first match wins)
+    risk_idx = _index_by_name(risk_report.project_summaries)
+    benefit_idx = _index_by_name(benefit_report.project_summaries) if benefit_report else None
+
+    # Per-project lookups: (rag, risk_count, expected, adjusted, drift)
+    signals = [_project_signals(project, risk_idx, benefit_idx) for project in projects]
 
-    for project in projects:
-        pi = _analyse_project_investment(project, risk_report, benefit_report)
-        project_investments.append(pi)
+    # Column-wise ROI arithmetic across the whole portfolio
+    n = len(projects)
+    budgets = np.fromiter((p.budget or 0.0 for p in projects), dtype=np.float64, count=n)
+    actuals = np.fromiter((p.actual_spend or 0.0 for p in projects), dtype=np.float64, count=n)
+    adjusted = np.fromiter((sig[3] for sig in signals), dtype=np.float64, count=n)
+    has_budget = budgets > 0
+    ctcs = np.maximum(0.0, budgets - actuals)
+    pcts = np.divide(actuals, budgets, out=np.zeros(n), where=has_budget)
+    rois = np.divide(adjusted - budgets, budgets, out=np.zeros(n), where=has_budget)
+
+    # Classify every project in one vectorised pass
+    rags = np.array([sig[0] for sig in signals], dtype=object)
+    drifts = np.fromiter((sig[4] for sig in signals), dtype=np.float64, count=n)
+    codes = _classify_actions(rags, rois, drifts, pcts)
+
+    project_investments: list[ProjectInvestment] = []
+    for project, (rag, risk_count, expected_benefit, adjusted_benefit, drift_pct), ctc, pct_consumed, roi, code in zip(
+        projects, signals, ctcs.tolist(), pcts.tolist(), rois.tolist(), codes.tolist(),
+    ):
+        action, rationale = _action_from_code(code, rag, roi, drift_pct, pct_consumed)
+        project_investments.append(ProjectInvestment(
+            project_name=project.name,
+            budget=project.budget or 0.0,
+            actual_spend=project.actual_spend or 0.0,
+            cost_to_complete=ctc,
+            pct_budget_consumed=pct_consumed,
+            expected_benefit=expected_benefit,
+            adjusted_benefit=adjusted_benefit,
+            roi=roi,
+            roi_rank=0,  # Set after sorting
+            rag_status=rag,
+            risk_count=risk_count,
+            drift_pct=drift_pct,
+            action=action,
+            action_rationale=rationale,
+        ))
 
     # Rank by ROI (highest first)
     sorted_by_roi = sorted(project_investments, key=lambda x: x.roi, reverse=True)
@@ -114,13 +174,15 @@ def analyse_investments(
     # Sort output by rank
     project_investments = sorted_by_roi
 
-    # Portfolio totals
-    total_budget = sum(p.budget for p in project_investments)
-    total_spent = sum(p.actual_spend for p in project_investments)
-    total_ctc = sum(p.cost_to_complete for p in project_investments)
+    # Portfolio totals (single pass)
+    total_budget = total_spent = total_ctc = total_expected = total_adjusted = 0.0
+    for p in project_investments:
+        total_budget += p.budget
+        total_spent += p.actual_spend
+        total_ctc += p.cost_to_complete
+        total_expected += p.expected_benefit
+        total_adjusted += p.adjusted_benefit
     pct_consumed = total_spent / total_budget if total_budget > 0 else 0.0
-    total_expected = sum(p.expected_benefit for p in project_investments)
-    total_adjusted = sum(p.adjusted_benefit for p in project_investments)
     portfolio_roi = (total_adjusted - total_budget) / total_budget if total_budget > 0 else 0.0
 
     # Top value at risk (projects where we're spending but benefit is eroding)
@@ -131,7 +193,7 @@ def analyse_investments(
     value_at_risk.sort(key=lambda x: x.budget, reverse=True)
 
     recommendations = _generate_investment_recommendations(
-        project_investments, total_budget, total_adjusted, portfolio_roi
+        group_by_action(project_investments), total_budget, total_adjusted, portfolio_roi
     )
 
     return PortfolioInvestmentReport(
@@ -148,114 +210,126 @@ def analyse_investments(
     )
 
 
+def group_by_action(
+    investments: list[ProjectInvestment],
+) -> dict[InvestmentAction, list[ProjectInvestment]]:
+    """Bucket investments by recommended action, preserving input order."""
+    groups: dict[InvestmentAction, list[ProjectInvestment]] = {}
+    for pi in investments:
+        groups.setdefault(pi.action, []).append(pi)
+    return groups
+
+
 # ──────────────────────────────────────────────
 # Per-project analysis
 # ──────────────────────────────────────────────
 
-def _analyse_project_investment(
+def _index_by_name(summaries: list[Any]) -> dict[str, Any]:
+    """Map lowercase project name → summary, keeping the first of any duplicates."""
+    idx: dict[str, Any] = {}
+    for s in summaries:
+        idx.setdefault(s.project_name.lower(), s)
+    return idx
+
+
+def _project_signals(
     project: Project,
-    risk_report: PortfolioRiskReport,
-    benefit_report: PortfolioBenefitReport | None,
-) -> ProjectInvestment:
-    budget = project.budget or 0.0
-    actual = project.actual_spend or 0.0
-    ctc = max(0, budget - actual)
-    pct_consumed = actual / budget if budget > 0 else 0.0
+    risk_idx: dict[str, ProjectRiskSummary],
+    benefit_idx: dict[str, ProjectBenefitSummary] | None,
+) -> tuple[str, int, float, float, float]:
+    """Look up RAG, risk count and benefit figures for one project.
+
+    Returns:
+        (rag, risk_count, expected_benefit, adjusted_benefit, drift_pct)
+    """
+    name_lower = project.name_lower
 
     # Get RAG and risk count from risk report
     rag = "Green"
     risk_count = 0
-    for s in risk_report.project_summaries:
-        if s.project_name.lower() == project.name.lower():
-            rag = s.rag_status
-            risk_count = s.risk_count
-            break
+    s = risk_idx.get(name_lower)
+    if s is not None:
+        rag = s.rag_status
+        risk_count = s.risk_count
 
     # Get benefit data
     expected_benefit = 0.0
     adjusted_benefit = 0.0
     drift_pct = 0.0
-    if benefit_report:
-        for bs in benefit_report.project_summaries:
-            if bs.project_name.lower() == project.name.lower():
-                expected_benefit = bs.total_expected
-                adjusted_benefit = bs.adjusted_expected
-                drift_pct = bs.drift_pct
-                break
+    if benefit_idx is not None:
+        bs = benefit_idx.get(name_lower)
+        if bs is not None:
+            expected_benefit = bs.total_expected
+            adjusted_benefit = bs.adjusted_expected
+            drift_pct = bs.drift_pct
     else:
         # No benefit report — use budget as proxy (conservative)
-        expected_benefit = budget
-        adjusted_benefit = budget * {"Red": 0.5, "Amber": 0.7, "Green": 0.9}.get(rag, 0.7)
-
-    # ROI calculation
-    roi = (adjusted_benefit - budget) / budget if budget > 0 else 0.0
-
-    # Invest/Hold/Divest decision
-    action, rationale = _determine_action(rag, roi, drift_pct, risk_count, pct_consumed)
-
-    return ProjectInvestment(
-        project_name=project.name,
-        budget=budget,
-        actual_spend=actual,
-        cost_to_complete=ctc,
-        pct_budget_consumed=pct_consumed,
-        expected_benefit=expected_benefit,
-        adjusted_benefit=adjusted_benefit,
-        roi=roi,
-        roi_rank=0,  # Set after sorting
-        rag_status=rag,
-        risk_count=risk_count,
-        drift_pct=drift_pct,
-        action=action,
-        action_rationale=rationale,
-    )
+        expected_benefit = project.budget or 0.0
+        adjusted_benefit = expected_benefit * _RAG_MULTIPLIER.get(rag, 0.7)
+
+    return rag, risk_count, expected_benefit, adjusted_benefit, drift_pct
+
+
+# Decision rules in precedence order; the first rule that holds wins.
+# Each entry is (action, rationale template) and its index is the action code.
+_ACTION_RULES: tuple[tuple[InvestmentAction, str], ...] = (
+    # 0. Strong positive ROI + Green/Amber = Invest
+    (InvestmentAction.INVEST,
+     "Strong ROI ({roi:.0%}) with manageable risk. "
+     "Consider accelerating delivery to realise benefits sooner."),
+    # 1. Positive ROI but Red / high drift = Review
+    (InvestmentAction.REVIEW,
+     "Positive ROI ({roi:.0%}) but delivery at risk (RAG: {rag}, drift: {drift:.0%}). "
+     "Protect the benefit case — resolve blockers or adjust scope to lock in remaining value."),
+    # 2. Negative ROI + Red = Divest
+    (InvestmentAction.DIVEST,
+     "Negative ROI ({roi:.0%}) and Red delivery status. "
+     "Recommend stopping discretionary spend and redirecting budget to higher-value projects."),
+    # 3. Negative ROI but Green = Review (might be early stage)
+    (InvestmentAction.REVIEW,
+     "ROI currently negative ({roi:.0%}) but delivery is on track. "
+     "May be early-stage investment — confirm benefit timeline and reassess at next cycle."),
+    # 4. High budget consumed + low ROI = Divest
+    (InvestmentAction.DIVEST,
+     "Budget {pct:.0%} consumed with minimal return ({roi:.0%} ROI). "
+     "Consider controlled wind-down or scope reduction."),
+    # 5. Default = Hold
+    (InvestmentAction.HOLD,
+     "Moderate position (ROI: {roi:.0%}, RAG: {rag}). "
+     "Continue current trajectory with standard risk monitoring."),
+)
+_HOLD_CODE = len(_ACTION_RULES) - 1
+
+
+def _classify_actions(
+    rags: np.ndarray, rois: np.ndarray, drifts: np.ndarray, pcts: np.ndarray,
+) -> np.ndarray:
+    """Vectorised Invest/Hold/Divest decision over the whole portfolio.
+
+    Args:
+        rags: Array of RAG strings.
+        rois, drifts, pcts: Float arrays of ROI, benefit drift and budget consumed.
+
+    Returns:
+        Integer array of indices into _ACTION_RULES.
+    """
+    red = rags == "Red"
+    green = rags == "Green"
+    conditions = [
+        (rois > 0.5) & (green | (rags == "Amber")) & (drifts < 0.3),
+        (rois > 0) & (red | (drifts > 0.3)),
+        (rois < 0) & red,
+        (rois < 0) & green,
+        (pcts > 0.8) & (rois < 0.1),
+    ]
+    return np.select(conditions, range(len(conditions)), default=_HOLD_CODE)
 
 
-def _determine_action(
-    rag: str, roi: float, drift_pct: float, risk_count: int, pct_consumed: float,
+def _action_from_code(
+    code: int, rag: str, roi: float, drift_pct: float, pct_consumed: float,
 ) -> tuple[InvestmentAction, str]:
-    """Determine Invest/Hold/Divest with rationale."""
-
-    # Strong positive ROI + Green/Amber = Invest
-    if roi > 0.5 and rag in ("Green", "Amber") and drift_pct < 0.3:
-        return InvestmentAction.INVEST, (
-            f"Strong ROI ({roi:.0%}) with manageable risk. "
-            f"Consider accelerating delivery to realise benefits sooner."
-        )
-
-    # Positive ROI but Red / high drift = Review
-    if roi > 0 and (rag == "Red" or drift_pct > 0.3):
-        return InvestmentAction.REVIEW, (
-            f"Positive ROI ({roi:.0%}) but delivery at risk (RAG: {rag}, drift: {drift_pct:.0%}). "
-            f"Protect the benefit case — resolve blockers or adjust scope to lock in remaining value."
-        )
-
-    # Negative ROI + Red = Divest
-    if roi < 0 and rag == "Red":
-        return InvestmentAction.DIVEST, (
-            f"Negative ROI ({roi:.0%}) and Red delivery status. "
-            f"Recommend stopping discretionary spend and redirecting budget to higher-value projects."
-        )
-
-    # Negative ROI but Green = Review (might be early stage)
-    if roi < 0 and rag == "Green":
-        return InvestmentAction.REVIEW, (
-            f"ROI currently negative ({roi:.0%}) but delivery is on track. "
-            f"May be early-stage investment — confirm benefit timeline and reassess at next cycle."
-        )
-
-    # High budget consumed + low ROI = Divest
-    if pct_consumed > 0.8 and roi < 0.1:
-        return InvestmentAction.DIVEST, (
-            f"Budget {pct_consumed:.0%} consumed with minimal return ({roi:.0%} ROI). "
-            f"Consider controlled wind-down or scope reduction."
-        )
-
-    # Default = Hold
-    return InvestmentAction.HOLD, (
-        f"Moderate position (ROI: {roi:.0%}, RAG: {rag}). "
-        f"Continue current trajectory with standard risk monitoring."
-    )
+    action, template = _ACTION_RULES[code]
+    return action, template.format(roi=roi, rag=rag, drift=drift_pct, pct=pct_consumed)
 
 
 # ──────────────────────────────────────────────
@@ -263,14 +337,14 @@ def _determine_action(
 # ──────────────────────────────────────────────
 
 def _generate_investment_recommendations(
-    investments: list[ProjectInvestment],
+    buckets: dict[InvestmentAction, list[ProjectInvestment]],
     total_budget: float, total_adjusted: float, portfolio_roi: float,
 ) -> list[str]:
     recs: list[str] = []
 
-    divests = [p for p in investments if p.action == InvestmentAction.DIVEST]
-    invests = [p for p in investments if p.action == InvestmentAction.INVEST]
-    reviews = [p for p in investments if p.action == InvestmentAction.REVIEW]
+    divests = buckets.get(InvestmentAction.DIVEST, [])
+    invests = buckets.get(InvestmentAction.INVEST, [])
+    reviews = buckets.get(InvestmentAction.REVIEW, [])
 
     if divests:
         names = ", ".join(p.project_name for p in divests[:3])
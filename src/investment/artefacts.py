@@ -6,21 +6,24 @@ Sprint 6 — Issue #34.
 
 from __future__ import annotations
 
+from copy import deepcopy
 from pathlib import Path
 
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
 
 from src.artefacts.docx_generator import (
-    BrandConfig,
+    BrandConfig, RAG_BG, RAG_COLOURS,
     _apply_base_styles, _add_header_bar, _add_section_heading, _add_footer,
     _maybe_add_logo, _set_cell_bg, _set_cell_margins, _remove_table_borders,
     _set_table_borders, _highlight_run, _add_decision_item, _h,
 )
 from src.investment import (
-    PortfolioInvestmentReport, InvestmentAction,
+    PortfolioInvestmentReport, InvestmentAction, group_by_action,
 )
 
 ACTION_COLOURS = {
@@ -30,6 +33,31 @@ ACTION_COLOURS = {
     InvestmentAction.DIVEST: ("922B21", "FADBD8"),
 }
 
+# Shared immutable style values, reused across every run and cell
+_WHITE = RGBColor(0xFF, 0xFF, 0xFF)
+_DARK_GREY = RGBColor(0x33, 0x33, 0x33)
+_MID_GREY = RGBColor(0x50, 0x50, 0x50)
+_LIGHT_GREY = RGBColor(0x70, 0x70, 0x70)
+_PT4, _PT6, _PT7, _PT8, _PT9, _PT10, _PT20 = (Pt(n) for n in (4, 6, 7, 8, 9, 10, 20))
+_INDENT = Inches(0.3)
+
+# Body-row cell properties, parsed once and cloned into each cell
+_ROW_MARGINS_XML = parse_xml(
+    f'<w:tcMar {nsdecls("w")}>'
+    + "".join(f'<w:{side} w:w="{val}" w:type="dxa"/>'
+              for side, val in (("top", 40), ("bottom", 40), ("start", 80), ("end", 80)))
+    + "</w:tcMar>"
+)
+_ZEBRA_SHADING_XML = {
+    bg: parse_xml(f'<w:shd {nsdecls("w")} w:fill="{bg}" w:val="clear"/>')
+    for bg in ("F8F9FA", "FFFFFF")
+}
+
+# Parsed once: action → (text RGBColor, background hex)
+ACTION_RGB = {a: (RGBColor.from_string(t), bg) for a, (t, bg) in ACTION_COLOURS.items()}
+_DEFAULT_ACTION_RGB = (_DARK_GREY, "F0F0F0")
+_DEFAULT_RAG_RGB = _DARK_GREY
+
 
 def generate_investment_report(
     investment_report: PortfolioInvestmentReport,
@@ -69,22 +97,22 @@ def generate_investment_report(
         _add_section_heading(doc, brand, "Value at Risk")
         for pi in investment_report.top_value_at_risk:
             p = doc.add_paragraph()
-            p.paragraph_format.space_after = Pt(4)
+            p.paragraph_format.space_after = _PT4
             badge_text, badge_bg = ACTION_COLOURS.get(pi.action, ("333333", "F0F0F0"))
             badge = p.add_run(f" {pi.action.value} ")
-            badge.font.size = Pt(8)
+            badge.font.size = _PT8
             badge.font.bold = True
-            badge.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
+            badge.font.color.rgb = _WHITE
             _highlight_run(badge, badge_text)
             name = p.add_run(f"  {pi.project_name}")
             name.font.bold = True
-            name.font.size = Pt(10)
+            name.font.size = _PT10
             p2 = doc.add_paragraph()
-            p2.paragraph_format.left_indent = Inches(0.3)
-            p2.paragraph_format.space_after = Pt(6)
+            p2.paragraph_format.left_indent = _INDENT
+            p2.paragraph_format.space_after = _PT6
             r = p2.add_run(pi.action_rationale)
-            r.font.size = Pt(9)
-            r.font.color.rgb = RGBColor(0x50, 0x50, 0x50)
+            r.font.size = _PT9
+            r.font.color.rgb = _MID_GREY
 
     # Recommendations
     _add_section_heading(doc, brand, "Recommendations")
@@ -122,16 +150,16 @@ def _add_investment_dashboard(doc: Document, report: PortfolioInvestmentReport,
         p = cell.paragraphs[0]
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = p.add_run(value)
-        run.font.size = Pt(20)
+        run.font.size = _PT20
         run.font.bold = True
-        run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
+        run.font.color.rgb = _WHITE
         run.font.name = brand.heading_font
         p2 = cell.add_paragraph()
         p2.alignment = WD_ALIGN_PARAGRAPH.CENTER
         r2 = p2.add_run(label)
-        r2.font.size = Pt(7)
+        r2.font.size = _PT7
         r2.font.bold = True
-        r2.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
+        r2.font.color.rgb = _WHITE
 
     doc.add_paragraph()
 
@@ -148,81 +176,92 @@ def _add_roi_table(doc: Document, report: PortfolioInvestmentReport, brand: Bran
         p = cell.paragraphs[0]
         run = p.add_run(text)
         run.font.bold = True
-        run.font.size = Pt(9)
-        run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
+        run.font.size = _PT9
+        run.font.color.rgb = _WHITE
 
     for idx, pi in enumerate(report.project_investments):
-        row = table.add_row()
-        bg = "F8F9FA" if idx % 2 == 0 else "FFFFFF"
-        row.cells[0].text = str(pi.roi_rank)
-        row.cells[1].text = pi.project_name
-        row.cells[2].text = f"£{pi.budget:,.0f}"
-        row.cells[3].text = f"{pi.roi:.0%}"
+        cells = table.add_row().cells
+        cells[0].text = pi.rank_str
+        cells[1].text = pi.project_name
+        cells[2].text = pi.budget_str
+        cells[3].text = pi.roi_str
 
         # Action cell with colour
-        action_cell = row.cells[4]
+        action_cell = cells[4]
         action_cell.text = ""
         p = action_cell.paragraphs[0]
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        text_col, bg_col = ACTION_COLOURS.get(pi.action, ("333333", "F0F0F0"))
+        text_rgb, bg_col = ACTION_RGB.get(pi.action, _DEFAULT_ACTION_RGB)
         run = p.add_run(f" {pi.action.value} ")
         run.font.bold = True
-        run.font.size = Pt(8)
+        run.font.size = _PT8
         run.font.name = "Calibri"
-        run.font.color.rgb = RGBColor.from_string(text_col)
+        run.font.color.rgb = text_rgb
         _set_cell_bg(action_cell, bg_col)
 
         # RAG cell
-        from src.artefacts.docx_generator import RAG_BG, RAG_COLOURS
-        rag_cell = row.cells[5]
+        rag_cell = cells[5]
         rag_cell.text = ""
         p = rag_cell.paragraphs[0]
         p.alignment = WD_ALIGN_PARAGRAPH.CENTER
         run = p.add_run(f" {pi.rag_status} ")
         run.font.bold = True
-        run.font.size = Pt(8)
+        run.font.size = _PT8
         run.font.name = "Calibri"
-        run.font.color.rgb = RAG_COLOURS.get(pi.rag_status, RGBColor(0x33, 0x33, 0x33))
+        run.font.color.rgb = RAG_COLOURS.get(pi.rag_status, _DEFAULT_RAG_RGB)
         _set_cell_bg(rag_cell, RAG_BG.get(pi.rag_status, "F0F0F0"))
 
-        for cell in row.cells:
-            if cell not in (action_cell, rag_cell):
-                _set_cell_bg(cell, bg)
-            _set_cell_margins(cell, 40, 40, 80, 80)
-            for paragraph in cell.paragraphs:
-                for r in paragraph.runs:
-                    if r.font.color.rgb is None:
-                        r.font.size = Pt(9)
+        _style_row(cells, "F8F9FA" if idx % 2 == 0 else "FFFFFF", coloured=(4, 5))
 
     _set_table_borders(table, "D5D8DC")
 
 
+def _style_row(cells: list, bg: str, coloured: tuple[int, ...] = ()) -> None:
+    """Apply zebra background, margins and 9pt body text to a table row.
+
+    Cell properties are cloned from pre-parsed XML rather than rebuilt per cell.
+
+    Args:
+        cells: The row's cells.
+        bg: Zebra background hex ("F8F9FA" or "FFFFFF").
+        coloured: Indices of cells that already carry their own background.
+    """
+    shading = _ZEBRA_SHADING_XML[bg]
+    for i, cell in enumerate(cells):
+        tcPr = cell._element.get_or_add_tcPr()
+        if i not in coloured:
+            tcPr.append(deepcopy(shading))
+        tcPr.append(deepcopy(_ROW_MARGINS_XML))
+        for paragraph in cell.paragraphs:
+            for r in paragraph.runs:
+                if r.font.color.rgb is None:
+                    r.font.size = _PT9
+
+
 def _add_action_summary(doc: Document, report: PortfolioInvestmentReport, brand: BrandConfig) -> None:
     """Visual summary of Invest/Hold/Divest breakdown."""
-    groups = {}
-    for pi in report.project_investments:
-        groups.setdefault(pi.action, []).append(pi)
+    groups = group_by_action(report.project_investments)
 
     for action in [InvestmentAction.INVEST, InvestmentAction.HOLD, InvestmentAction.REVIEW, InvestmentAction.DIVEST]:
         items = groups.get(action, [])
         if not items:
             continue
-        text_col, bg_col = ACTION_COLOURS.get(action, ("333333", "F0F0F0"))
+        text_rgb, bg_col = ACTION_RGB.get(action, _DEFAULT_ACTION_RGB)
         p = doc.add_paragraph()
-        p.paragraph_format.space_before = Pt(4)
+        p.paragraph_format.space_before = _PT4
         badge = p.add_run(f" {action.value.upper()} ({len(items)}) ")
-        badge.font.size = Pt(9)
+        badge.font.size = _PT9
         badge.font.bold = True
-        badge.font.color.rgb = RGBColor.from_string(text_col)
+        badge.font.color.rgb = text_rgb
         _highlight_run(badge, bg_col)
         names = p.add_run(f"  {', '.join(pi.project_name for pi in items)}")
-        names.font.size = Pt(10)
+        names.font.size = _PT10
 
         # Total budget in this group
         total = sum(pi.budget for pi in items)
         p2 = doc.add_paragraph()
-        p2.paragraph_format.left_indent = Inches(0.3)
-        p2.paragraph_format.space_after = Pt(6)
+        p2.paragraph_format.left_indent = _INDENT
+        p2.paragraph_format.space_after = _PT6
         r = p2.add_run(f"Combined budget: £{total:,.0f}")
-        r.font.size = Pt(9)
-        r.font.color.rgb = RGBColor(0x70, 0x70, 0x70)
+        r.font.size = _PT9
+        r.font.color.rgb = _LIGHT_GREY
@@ -10,11 +10,17 @@ Sprint 1 — Week 2 deliverable.
 
 from __future__ import annotations
 
+import re
+import sys
+
 from src.ingestion.parser import Project, Task
-from src.risk_engine.engine import Risk, RiskCategory, RiskSeverity
+from src.risk_engine.engine import SEVERITIES_BY_ORDER, SEVERITY_ORDER, Risk, RiskCategory, RiskSeverity
 
-# Statuses that indicate a task is blocked (normalised to lowercase)
-BLOCKED_STATUSES = {"blocked", "waiting", "on hold", "on_hold", "on-hold", "suspended"}
+# Statuses that indicate a task is blocked (normalised to lowercase, interned to
+# match Task.status_norm by identity)
+BLOCKED_STATUSES = frozenset(
+    sys.intern(s) for s in ("blocked", "waiting", "on hold", "on_hold", "on-hold", "suspended")
+)
 
 # Keywords in comments that indicate an external blocker
 BLOCKER_KEYWORDS = [
@@ -27,12 +33,18 @@ BLOCKER_KEYWORDS = [
     "stalled",
 ]
 
-# Priority mapping for severity calculation
+# All BLOCKER_KEYWORDS as one case-insensitive alternation, scanned in a single pass
+_BLOCKER_RE = re.compile("|".join(map(re.escape, BLOCKER_KEYWORDS)), re.IGNORECASE | re.ASCII)
+
+# Priority mapping for severity calculation (keys interned like Task.priority_norm)
 PRIORITY_SEVERITY: dict[str, RiskSeverity] = {
-    "critical": RiskSeverity.CRITICAL,
-    "high": RiskSeverity.HIGH,
-    "medium": RiskSeverity.MEDIUM,
-    "low": RiskSeverity.LOW,
+    sys.intern(priority): severity
+    for priority, severity in (
+        ("critical", RiskSeverity.CRITICAL),
+        ("high", RiskSeverity.HIGH),
+        ("medium", RiskSeverity.MEDIUM),
+        ("low", RiskSeverity.LOW),
+    )
 }
 
 
@@ -54,17 +66,23 @@ def detect_blocked_work(project: Project) -> list[Risk]:
     Returns:
         List of Risk objects for blocked work found, sorted by severity (worst first).
     """
-    risks: list[Risk] = []
+    # One bucket per severity level, worst first — concatenated instead of sorted
+    buckets: tuple[list[Risk], ...] = ([], [], [], [])
 
     for task in project.tasks:
         status_blocked = _is_status_blocked(task)
-        comment_blocked, blocker_detail = _has_blocker_keyword(task)
+        if task.comments:
+            comment_blocked, blocker_detail = _has_blocker_keyword(task)
+        elif status_blocked:
+            comment_blocked, blocker_detail = False, ""
+        else:
+            continue  # Fast path: not blocked and nothing to scan
 
         if not status_blocked and not comment_blocked:
             continue
 
         # Determine base severity from task priority
-        base_severity = _severity_from_priority(task.priority)
+        base_severity = _severity_from_priority(task)
 
         # Elevate severity if both status AND comment indicate blocking
         if status_blocked and comment_blocked:
@@ -72,19 +90,25 @@ def detect_blocked_work(project: Project) -> list[Risk]:
         else:
             severity = base_severity
 
+        # Display casing, computed once and shared by the text builders below
+        status_lower = task.status.lower()
+        priority_lower = task.priority.lower()
+
         # Build explanation
-        explanation = _build_explanation(project.name, task, status_blocked, comment_blocked, blocker_detail)
+        explanation = _build_explanation(
+            project.name, task, status_blocked, comment_blocked, blocker_detail, status_lower, priority_lower,
+        )
 
         # Build mitigation suggestion
-        mitigation = _build_mitigation(task, status_blocked, comment_blocked, blocker_detail)
+        mitigation = _build_mitigation(task, status_blocked, comment_blocked, blocker_detail, priority_lower)
 
         # Build title
         if status_blocked:
-            title = f"'{task.name}' is stuck ({task.status.lower()}) — delivery blocked"
+            title = f"'{task.name}' is stuck ({status_lower}) — delivery blocked"
         else:
             title = f"'{task.name}' has a reported blocker — needs resolution"
 
-        risks.append(Risk(
+        buckets[SEVERITY_ORDER[severity]].append(Risk(
             project_name=project.name,
             category=RiskCategory.BLOCKED_WORK,
             severity=severity,
@@ -93,16 +117,7 @@ def detect_blocked_work(project: Project) -> list[Risk]:
             suggested_mitigation=mitigation,
         ))
 
-    # Sort by severity (Critical first)
-    severity_order = {
-        RiskSeverity.CRITICAL: 0,
-        RiskSeverity.HIGH: 1,
-        RiskSeverity.MEDIUM: 2,
-        RiskSeverity.LOW: 3,
-    }
-    risks.sort(key=lambda r: severity_order.get(r.severity, 99))
-
-    return risks
+    return [risk for bucket in buckets for risk in bucket]
 
 
 # ──────────────────────────────────────────────
@@ -112,7 +127,7 @@ def detect_blocked_work(project: Project) -> list[Risk]:
 
 def _is_status_blocked(task: Task) -> bool:
     """Check if task status indicates it's blocked."""
-    return task.status.strip().lower() in BLOCKED_STATUSES
+    return task.status_norm in BLOCKED_STATUSES
 
 
 def _has_blocker_keyword(task: Task) -> tuple[bool, str]:
@@ -120,26 +135,24 @@ def _has_blocker_keyword(task: Task) -> tuple[bool, str]:
 
     Returns:
         Tuple of (is_blocked, matched_keyword_context).
-        The context is the surrounding text of the first match for use in explanations.
+        The context is the text around the earliest match, for use in explanations.
     """
-    if not task.comments:
+    comments = task.comments
+    if not comments:
         return False, ""
 
-    comments_lower = task.comments.lower()
-    for keyword in BLOCKER_KEYWORDS:
-        pos = comments_lower.find(keyword)
-        if pos != -1:
-            # Extract context: up to 80 chars around the keyword
-            start = max(0, pos - 20)
-            end = min(len(task.comments), pos + len(keyword) + 60)
-            context = task.comments[start:end].strip()
-            if start > 0:
-                context = "..." + context
-            if end < len(task.comments):
-                context = context + "..."
-            return True, context
+    # Earliest blocker mention in the text; the scan stops at the first hit
+    m = _BLOCKER_RE.search(comments)
+    if m is None:
+        return False, ""
 
-    return False, ""
+    # Extract context: up to 80 chars around the keyword
+    start = max(0, m.start() - 20)
+    end = min(len(comments), m.end() + 60)
+    context = comments[start:end]  # Never empty: it contains the match
+    if context[0].isspace() or context[-1].isspace():
+        context = context.strip()
+    return True, f"{'...' if start > 0 else ''}{context}{'...' if end < len(comments) else ''}"
 
 
 # ──────────────────────────────────────────────
@@ -147,20 +160,15 @@ def _has_blocker_keyword(task: Task) -> tuple[bool, str]:
 # ──────────────────────────────────────────────
 
 
-def _severity_from_priority(priority: str) -> RiskSeverity:
+def _severity_from_priority(task: Task) -> RiskSeverity:
     """Map task priority to risk severity."""
-    return PRIORITY_SEVERITY.get(priority.strip().lower(), RiskSeverity.MEDIUM)
+    return PRIORITY_SEVERITY.get(task.priority_norm, RiskSeverity.MEDIUM)
 
 
 def _elevate_severity(severity: RiskSeverity) -> RiskSeverity:
     """Elevate severity by one level (e.g., High → Critical)."""
-    elevation = {
-        RiskSeverity.LOW: RiskSeverity.MEDIUM,
-        RiskSeverity.MEDIUM: RiskSeverity.HIGH,
-        RiskSeverity.HIGH: RiskSeverity.CRITICAL,
-        RiskSeverity.CRITICAL: RiskSeverity.CRITICAL,  # Can't go higher
-    }
-    return elevation[severity]
+    # Critical is order 0 and can't go higher
+    return SEVERITIES_BY_ORDER[max(SEVERITY_ORDER[severity] - 1, 0)]
 
 
 # ──────────────────────────────────────────────
@@ -174,13 +182,15 @@ def _build_explanation(
     status_blocked: bool,
     comment_blocked: bool,
     blocker_detail: str,
+    status_lower: str,
+    priority_lower: str,
 ) -> str:
     """Build an insight-driven risk explanation. Leads with impact, not database fields."""
     assignee = task.assignee or "no owner assigned"
 
     if status_blocked and comment_blocked:
         return (
-            f"'{task.name}' is stuck — currently {task.status.lower()} "
+            f"'{task.name}' is stuck — currently {status_lower} "
             f"with a reported blocker ({blocker_detail}). "
             f"Assigned to {assignee}. Until this is resolved, "
             f"downstream work in {project_name} cannot progress."
@@ -190,15 +200,15 @@ def _build_explanation(
         if task.comments:
             detail = f" Context: \"{task.comments[:100]}{'...' if len(task.comments) > 100 else ''}\"."
         return (
-            f"'{task.name}' has been {task.status.lower()} with {assignee} "
+            f"'{task.name}' has been {status_lower} with {assignee} "
             f"and no clear resolution path.{detail} "
-            f"This is a {task.priority.lower()}-priority deliverable for {project_name}."
+            f"This is a {priority_lower}-priority deliverable for {project_name}."
         )
     else:
         return (
             f"'{task.name}' ({assignee}) has a dependency blocker: "
             f"{blocker_detail}. "
-            f"This {task.priority.lower()}-priority task cannot advance until "
+            f"This {priority_lower}-priority task cannot advance until "
             f"the blocker is cleared."
         )
 
@@ -208,26 +218,31 @@ def _build_mitigation(
     status_blocked: bool,
     comment_blocked: bool,
     blocker_detail: str,
+    priority_lower: str,
 ) -> str:
     """Build a suggested mitigation action."""
-    mitigations: list[str] = []
-
-    if status_blocked:
-        mitigations.append(
-            f"Escalate the blocker on '{task.name}' — identify the blocking party "
-            f"and set a resolution deadline."
-        )
-
-    if comment_blocked:
-        mitigations.append(
-            f"Review the dependency: {blocker_detail[:80]}. "
-            f"Assign an owner to chase resolution."
-        )
-
-    if task.priority.lower() in ("critical", "high"):
-        mitigations.append(
-            f"Consider this a priority escalation — {task.priority.lower()}-priority "
-            f"work is stalled."
-        )
-
-    return " ".join(mitigations) if mitigations else "Investigate and resolve the blocker."
+    flag = (status_blocked << 2) | (comment_blocked << 1) | (priority_lower in ("critical", "high"))
+    return _MITIGATION_TEMPLATES[flag].format_map({
+        "task_name": task.name,
+        "blocker": blocker_detail[:80],
+        "priority": priority_lower,
+    })
+
+
+# Mitigation clauses, in the order they are joined
+_ESCALATE_CLAUSE = (
+    "Escalate the blocker on '{task_name}' — identify the blocking party "
+    "and set a resolution deadline."
+)
+_DEPENDENCY_CLAUSE = "Review the dependency: {blocker}. Assign an owner to chase resolution."
+_PRIORITY_CLAUSE = "Consider this a priority escalation — {priority}-priority work is stalled."
+
+# One template per (status_blocked, comment_blocked, high_priority) bit pattern
+_MITIGATION_TEMPLATES: tuple[str, ...] = tuple(
+    " ".join(
+        clause
+        for bit, clause in ((4, _ESCALATE_CLAUSE), (2, _DEPENDENCY_CLAUSE), (1, _PRIORITY_CLAUSE))
+        if flag & bit
+    ) or "Investigate and resolve the blocker."
+    for flag in range(8)
+)
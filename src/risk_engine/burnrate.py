@@ -11,6 +11,9 @@ Sprint 1 — Week 3 deliverable.
 from __future__ import annotations
 
 from datetime import date
+from functools import lru_cache
+
+import numpy as np
 
 from src.ingestion.parser import Project
 from src.risk_engine.engine import Risk, RiskCategory, RiskSeverity
@@ -35,41 +38,72 @@ def detect_burn_rate(project: Project, reference_date: date | None = None) -> li
     Returns:
         List of Risk objects for burn rate alerts (0 or 1 per project).
     """
-    if reference_date is None:
-        reference_date = date.today()
-
-    # Skip if no budget data
-    if project.budget <= 0:
-        return []
+    return detect_burn_rate_batch([project], reference_date)[0]
 
-    # Calculate spend percentage
-    spend_pct = project.actual_spend / project.budget
 
-    # Check for overspend first (actual > budget)
-    if spend_pct > 1.0:
-        return [_build_overspend_risk(project, spend_pct)]
+def detect_burn_rate_batch(
+    projects: list[Project], reference_date: date | None = None,
+) -> list[list[Risk]]:
+    """Run burn rate detection over a whole portfolio at once.
 
-    # Need dates to calculate time remaining
-    if project.start_date is None or project.end_date is None:
-        # Can still flag if spend is very high even without dates
-        if spend_pct >= SPEND_THRESHOLD:
-            return [_build_high_spend_no_dates_risk(project, spend_pct)]
-        return []
+    The numeric gates are evaluated column-wise with NumPy; Python only
+    builds Risk objects for the projects that trip a rule.
 
-    # Calculate time elapsed and remaining
-    total_duration = (project.end_date - project.start_date).days
-    if total_duration <= 0:
-        return []
+    Args:
+        projects: Parsed Project objects.
+        reference_date: Date to calculate against (defaults to today).
 
-    elapsed = (reference_date - project.start_date).days
-    time_elapsed_pct = max(0.0, min(1.0, elapsed / total_duration))
-    time_remaining_pct = 1.0 - time_elapsed_pct
+    Returns:
+        One list of Risk objects (0 or 1 items) per project, in input order.
+    """
+    if reference_date is None:
+        reference_date = date.today()
 
-    # Burn rate alert: high spend with significant time remaining
-    if spend_pct >= SPEND_THRESHOLD and time_remaining_pct > TIME_REMAINING_THRESHOLD:
-        return [_build_burn_rate_risk(project, spend_pct, time_elapsed_pct, time_remaining_pct)]
+    n = len(projects)
+    budgets = np.fromiter((p.budget for p in projects), dtype=np.float64, count=n)
+    actuals = np.fromiter((p.actual_spend for p in projects), dtype=np.float64, count=n)
+    has_dates = np.fromiter(
+        (p.start_ord is not None and p.end_ord is not None for p in projects), dtype=bool, count=n,
+    )
+    starts = np.fromiter((p.start_ord or 0 for p in projects), dtype=np.int64, count=n)
+    ends = np.fromiter((p.end_ord or 0 for p in projects), dtype=np.int64, count=n)
 
-    return []
+    # Skip if no budget data
+    has_budget = budgets > 0
+    spend_pcts = np.divide(actuals, budgets, out=np.zeros(n), where=has_budget)
+
+    # Time elapsed/remaining, only meaningful where both dates give a positive duration
+    total_durations = ends - starts
+    timed = has_budget & has_dates & (total_durations > 0)
+    elapsed = reference_date.toordinal() - starts
+    time_elapsed_pcts = np.clip(
+        np.divide(elapsed, total_durations, out=np.zeros(n), where=timed), 0.0, 1.0,
+    )
+    time_remaining_pcts = 1.0 - time_elapsed_pcts
+
+    # Rule masks, in precedence order
+    overspend = has_budget & (spend_pcts > 1.0)
+    high_spend = has_budget & ~overspend & (spend_pcts >= SPEND_THRESHOLD)
+    no_dates = high_spend & ~has_dates
+    burning = high_spend & timed & (time_remaining_pcts > TIME_REMAINING_THRESHOLD)
+
+    severity_codes = _classify(spend_pcts, time_remaining_pcts)
+
+    results: list[list[Risk]] = [[] for _ in range(n)]
+    for i in np.flatnonzero(overspend | no_dates | burning).tolist():
+        project = projects[i]
+        spend_pct = float(spend_pcts[i])
+        if overspend[i]:
+            results[i].append(_build_overspend_risk(project, spend_pct))
+        elif no_dates[i]:
+            # Can still flag if spend is very high even without dates
+            results[i].append(_build_high_spend_no_dates_risk(project, spend_pct))
+        else:
+            results[i].append(_build_burn_rate_risk(
+                project, spend_pct, float(time_elapsed_pcts[i]), float(time_remaining_pcts[i]),
+                _SEVERITY_BY_CODE[severity_codes[i]],
+            ))
+    return results
 
 
 # ──────────────────────────────────────────────
@@ -80,23 +114,24 @@ def detect_burn_rate(project: Project, reference_date: date | None = None) -> li
 def _build_overspend_risk(project: Project, spend_pct: float) -> Risk:
     """Build risk for project that has exceeded its budget."""
     overspend_amount = project.actual_spend - project.budget
+    overspend_str = _fmt_currency(overspend_amount)
 
     return Risk(
         project_name=project.name,
         category=RiskCategory.BURN_RATE,
         severity=RiskSeverity.CRITICAL,
-        title=f"{project.name} is over budget by {_fmt_currency(overspend_amount)}",
+        title=f"{project.name} is over budget by {overspend_str}",
         explanation=(
             f"{project.name} has spent {_fmt_currency(project.actual_spend)} "
             f"against a {_fmt_currency(project.budget)} budget — "
             f"{_fmt_pct(spend_pct)} consumed. "
-            f"The project is {_fmt_currency(overspend_amount)} over budget "
+            f"The project is {overspend_str} over budget "
             f"with no additional funding approved. "
             f"Every week of continued spend deepens the overrun."
         ),
         suggested_mitigation=(
             f"Halt non-critical spend on {project.name} immediately. "
-            f"Present options to the sponsor: approve a {_fmt_currency(overspend_amount)}+ "
+            f"Present options to the sponsor: approve a {overspend_str}+ "
             f"budget top-up, or cut remaining scope to close within current allocation."
         ),
     )
@@ -107,31 +142,36 @@ def _build_burn_rate_risk(
     spend_pct: float,
     time_elapsed_pct: float,
     time_remaining_pct: float,
+    severity: RiskSeverity | None = None,
 ) -> Risk:
     """Build risk for project burning budget faster than time elapsed."""
-    severity = _burn_rate_severity(spend_pct, time_remaining_pct)
+    if severity is None:
+        severity = _burn_rate_severity(spend_pct, time_remaining_pct)
     remaining_budget = project.budget - project.actual_spend
+    spend_pct_str = _fmt_pct(spend_pct)
+    time_remaining_str = _fmt_pct(time_remaining_pct)
+    remaining_budget_str = _fmt_currency(remaining_budget)
 
     return Risk(
         project_name=project.name,
         category=RiskCategory.BURN_RATE,
         severity=severity,
         title=(
-            f"{project.name}: {_fmt_pct(spend_pct)} of budget gone, "
-            f"{_fmt_pct(time_remaining_pct)} of timeline left"
+            f"{project.name}: {spend_pct_str} of budget gone, "
+            f"{time_remaining_str} of timeline left"
         ),
         explanation=(
             f"{project.name} is burning cash faster than the clock. "
             f"{_fmt_currency(project.actual_spend)} spent of {_fmt_currency(project.budget)} "
-            f"({_fmt_pct(spend_pct)}), but {_fmt_pct(time_remaining_pct)} of the delivery "
-            f"window remains. Only {_fmt_currency(remaining_budget)} left to cover "
+            f"({spend_pct_str}), but {time_remaining_str} of the delivery "
+            f"window remains. Only {remaining_budget_str} left to cover "
             f"the remaining work. At current velocity, the budget will run out "
             f"before delivery completes."
         ),
         suggested_mitigation=(
             f"Three options for leadership: (1) Approve a budget top-up of "
             f"~{_fmt_currency(remaining_budget * 0.5)} to provide runway, "
-            f"(2) Cut scope to fit remaining {_fmt_currency(remaining_budget)}, or "
+            f"(2) Cut scope to fit remaining {remaining_budget_str}, or "
             f"(3) Accelerate the timeline to reduce fixed costs. "
             f"Decision needed within 2 weeks."
         ),
@@ -140,13 +180,15 @@ def _build_burn_rate_risk(
 
 def _build_high_spend_no_dates_risk(project: Project, spend_pct: float) -> Risk:
     """Build risk for high spend without date information."""
+    spend_pct_str = _fmt_pct(spend_pct)
+
     return Risk(
         project_name=project.name,
         category=RiskCategory.BURN_RATE,
         severity=RiskSeverity.HIGH,
-        title=f"{project.name}: {_fmt_pct(spend_pct)} of budget consumed — no timeline data",
+        title=f"{project.name}: {spend_pct_str} of budget consumed — no timeline data",
         explanation=(
-            f"{project.name} has burned through {_fmt_pct(spend_pct)} of its "
+            f"{project.name} has burned through {spend_pct_str} of its "
             f"{_fmt_currency(project.budget)} budget "
             f"({_fmt_currency(project.actual_spend)} spent). "
             f"No timeline data is available, so it's unclear whether this "
@@ -180,11 +222,24 @@ def _burn_rate_severity(spend_pct: float, time_remaining_pct: float) -> RiskSeve
         return RiskSeverity.MEDIUM
 
 
+# Severity codes returned by _classify, indexed in the same order as
+# the branches of _burn_rate_severity.
+_SEVERITY_BY_CODE = (RiskSeverity.CRITICAL, RiskSeverity.HIGH, RiskSeverity.MEDIUM)
+
+
+def _classify(spend_pcts: np.ndarray, time_remaining_pcts: np.ndarray) -> np.ndarray:
+    """Vectorised _burn_rate_severity, returning _SEVERITY_BY_CODE indices."""
+    critical = (spend_pcts >= 0.95) | ((spend_pcts >= 0.90) & (time_remaining_pcts >= 0.20))
+    return np.where(critical, 0, np.where(spend_pcts >= 0.90, 1, 2)).astype(np.int8)
+
+
+@lru_cache(maxsize=128)
 def _fmt_pct(value: float) -> str:
     """Format a float as a percentage string."""
     return f"{value:.0%}"
 
 
+@lru_cache(maxsize=128)
 def _fmt_currency(value: float) -> str:
     """Format a float as a currency string (no symbol, with commas)."""
     return f"{value:,.0f}"
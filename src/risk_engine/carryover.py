@@ -11,7 +11,7 @@ Sprint 1 — Week 2 deliverable.
 from __future__ import annotations
 
 from src.ingestion.parser import Project, Task
-from src.risk_engine.engine import Risk, RiskCategory, RiskSeverity
+from src.risk_engine.engine import SEVERITY_ORDER, Risk, RiskCategory, RiskSeverity
 
 # Default: flag tasks carried over across 3+ sprints
 CARRYOVER_THRESHOLD = 3
@@ -24,6 +24,20 @@ PRIORITY_SEVERITY: dict[str, RiskSeverity] = {
     "low": RiskSeverity.LOW,
 }
 
+# Severity one level up, applied to tasks carried over 5+ sprints
+_ELEVATE_5PLUS: dict[RiskSeverity, RiskSeverity] = {
+    RiskSeverity.LOW: RiskSeverity.MEDIUM,
+    RiskSeverity.MEDIUM: RiskSeverity.HIGH,
+    RiskSeverity.HIGH: RiskSeverity.CRITICAL,
+    RiskSeverity.CRITICAL: RiskSeverity.CRITICAL,
+}
+
+# Priorities that get an extra escalation note in the mitigation
+_HIGH_PRIORITIES = frozenset({"critical", "high"})
+
+# Statuses that mean a task is finished (normalised to lowercase)
+COMPLETE_STATUSES = frozenset({"done", "complete", "completed", "closed", "resolved"})
+
 
 def detect_carryover(project: Project, threshold: int = CARRYOVER_THRESHOLD) -> list[Risk]:
     """Detect tasks carried over across multiple sprints.
@@ -57,6 +71,9 @@ def detect_carryover(project: Project, threshold: int = CARRYOVER_THRESHOLD) ->
         # Determine severity
         severity = _calculate_severity(task, sprint_count)
 
+        # Display casing, computed once and shared by the explanation and mitigation
+        priority_lower = task.priority.lower()
+
         # Build sprint history string for explanation
         all_sprints = task.previous_sprints + ([task.sprint] if task.sprint else [])
         sprint_history = " → ".join(all_sprints)
@@ -64,12 +81,12 @@ def detect_carryover(project: Project, threshold: int = CARRYOVER_THRESHOLD) ->
         explanation = (
             f"'{task.name}' has bounced across {sprint_count} sprints "
             f"({sprint_history}) without getting done. "
-            f"Assigned to {task.assignee or 'nobody'} at {task.priority.lower()} priority. "
+            f"Assigned to {task.assignee or 'nobody'} at {priority_lower} priority. "
             f"This is a delivery smell — either the task is too large, "
             f"blocked on something unstated, or consistently deprioritised."
         )
 
-        mitigation = _build_mitigation(task, sprint_count)
+        mitigation = _build_mitigation(task, sprint_count, priority_lower)
 
         risks.append(Risk(
             project_name=project.name,
@@ -81,13 +98,7 @@ def detect_carryover(project: Project, threshold: int = CARRYOVER_THRESHOLD) ->
         ))
 
     # Sort by severity (Critical first)
-    severity_order = {
-        RiskSeverity.CRITICAL: 0,
-        RiskSeverity.HIGH: 1,
-        RiskSeverity.MEDIUM: 2,
-        RiskSeverity.LOW: 3,
-    }
-    risks.sort(key=lambda r: severity_order.get(r.severity, 99))
+    risks.sort(key=lambda r: SEVERITY_ORDER[r.severity])
 
     return risks
 
@@ -99,7 +110,7 @@ def detect_carryover(project: Project, threshold: int = CARRYOVER_THRESHOLD) ->
 
 def _is_complete(task: Task) -> bool:
     """Check if a task is in a completed state."""
-    return task.status.strip().lower() in {"done", "complete", "completed", "closed", "resolved"}
+    return task.status_norm in COMPLETE_STATUSES
 
 
 def _calculate_severity(task: Task, sprint_count: int) -> RiskSeverity:
@@ -107,41 +118,41 @@ def _calculate_severity(task: Task, sprint_count: int) -> RiskSeverity:
 
     Base severity comes from task priority. Elevated if carried over 5+ sprints.
     """
-    base = PRIORITY_SEVERITY.get(task.priority.strip().lower(), RiskSeverity.MEDIUM)
+    base = PRIORITY_SEVERITY.get(task.priority_norm, RiskSeverity.MEDIUM)
 
     # Elevate if carried over many sprints (5+)
     if sprint_count >= 5:
-        elevation = {
-            RiskSeverity.LOW: RiskSeverity.MEDIUM,
-            RiskSeverity.MEDIUM: RiskSeverity.HIGH,
-            RiskSeverity.HIGH: RiskSeverity.CRITICAL,
-            RiskSeverity.CRITICAL: RiskSeverity.CRITICAL,
-        }
-        return elevation[base]
+        return _ELEVATE_5PLUS[base]
 
     return base
 
 
-def _build_mitigation(task: Task, sprint_count: int) -> str:
+# Mitigation clauses, in the order they are joined
+_REVIEW_CLAUSE = (
+    "Review why '{task_name}' has not been completed after {sprint_count} sprints. "
+    "Consider whether it needs to be re-scoped, broken into smaller tasks, "
+    "or escalated."
+)
+_EXCESSIVE_CLAUSE = (
+    "This task has been carried over excessively — consider a dedicated "
+    "spike or assigning additional resource to unblock it."
+)
+_PRIORITY_CLAUSE = "As a {priority}-priority item, continued delay may impact project milestones."
+
+# One template per (5+ sprints, high priority) bit pattern; the review clause is always included
+_MITIGATION_TEMPLATES: tuple[str, ...] = (
+    _REVIEW_CLAUSE,
+    " ".join((_REVIEW_CLAUSE, _PRIORITY_CLAUSE)),
+    " ".join((_REVIEW_CLAUSE, _EXCESSIVE_CLAUSE)),
+    " ".join((_REVIEW_CLAUSE, _EXCESSIVE_CLAUSE, _PRIORITY_CLAUSE)),
+)
+
+
+def _build_mitigation(task: Task, sprint_count: int, priority_lower: str) -> str:
     """Build suggested mitigation for carry-over risk."""
-    parts: list[str] = []
-
-    parts.append(
-        f"Review why '{task.name}' has not been completed after {sprint_count} sprints. "
-        f"Consider whether it needs to be re-scoped, broken into smaller tasks, "
-        f"or escalated."
-    )
-
-    if sprint_count >= 5:
-        parts.append(
-            "This task has been carried over excessively — consider a dedicated "
-            "spike or assigning additional resource to unblock it."
-        )
-
-    if task.priority.lower() in ("critical", "high"):
-        parts.append(
-            f"As a {task.priority.lower()}-priority item, continued delay "
-            f"may impact project milestones."
-        )
-
-    return " ".join(parts)
+    flag = ((sprint_count >= 5) << 1) | (priority_lower in _HIGH_PRIORITIES)
+    return _MITIGATION_TEMPLATES[flag].format_map({
+        "task_name": task.name,
+        "sprint_count": sprint_count,
+        "priority": priority_lower,
+    })
@@ -13,7 +13,7 @@ from __future__ import annotations
 import re
 
 from src.ingestion.parser import Project, Task
-from src.risk_engine.engine import Risk, RiskCategory, RiskSeverity
+from src.risk_engine.engine import SEVERITY_ORDER, Risk, RiskCategory, RiskSeverity
 
 # Keywords that indicate a dependency relationship
 DEPENDENCY_KEYWORDS = [
@@ -29,11 +29,17 @@ DEPENDENCY_KEYWORDS = [
     "needs",
 ]
 
+# All DEPENDENCY_KEYWORDS as one alternation (longest first), scanned in a single pass
+_DEPENDENCY_RE = re.compile("|".join(map(re.escape, sorted(DEPENDENCY_KEYWORDS, key=len, reverse=True))))
+
+# Sentence boundaries that end a dependency context: ". ", ".\n", "\n", ";" or ","
+_CONTEXT_END_RE = re.compile(r"\.[ \n]|[\n;,]")
+
 # Statuses that indicate the task is still active (dependency matters)
-ACTIVE_STATUSES = {
+ACTIVE_STATUSES = frozenset({
     "to do", "todo", "in progress", "in-progress", "open", "new",
     "blocked", "waiting", "on hold", "on_hold", "on-hold",
-}
+})
 
 # Priority mapping
 PRIORITY_SEVERITY: dict[str, RiskSeverity] = {
@@ -43,6 +49,23 @@ PRIORITY_SEVERITY: dict[str, RiskSeverity] = {
     "low": RiskSeverity.LOW,
 }
 
+# Severity elevation for tasks with 3+ and 2 dependencies
+_ELEVATE_DEP3: dict[RiskSeverity, RiskSeverity] = {
+    RiskSeverity.LOW: RiskSeverity.HIGH,
+    RiskSeverity.MEDIUM: RiskSeverity.HIGH,
+    RiskSeverity.HIGH: RiskSeverity.CRITICAL,
+    RiskSeverity.CRITICAL: RiskSeverity.CRITICAL,
+}
+_ELEVATE_DEP2: dict[RiskSeverity, RiskSeverity] = {
+    RiskSeverity.LOW: RiskSeverity.MEDIUM,
+    RiskSeverity.MEDIUM: RiskSeverity.HIGH,
+    RiskSeverity.HIGH: RiskSeverity.CRITICAL,
+    RiskSeverity.CRITICAL: RiskSeverity.CRITICAL,
+}
+
+# Priorities whose unresolved dependencies should be escalated
+_HIGH_PRIORITIES = frozenset({"critical", "high"})
+
 
 def detect_dependencies(project: Project) -> list[Risk]:
     """Detect tasks with unresolved dependency chains in comments.
@@ -83,7 +106,7 @@ def detect_dependencies(project: Project) -> list[Risk]:
             f"{'Multiple dependencies compound the risk — if any one slips, this task stalls.' if dep_count > 1 else 'If this dependency slips, the task stalls.'}"
         )
 
-        mitigation = _build_mitigation(task, matches, dep_count)
+        mitigation = _build_mitigation(task, matches, dep_count, task.priority.lower())
 
         title = (
             f"'{task.name}': {dep_count} "
@@ -100,13 +123,7 @@ def detect_dependencies(project: Project) -> list[Risk]:
         ))
 
     # Sort by severity
-    severity_order = {
-        RiskSeverity.CRITICAL: 0,
-        RiskSeverity.HIGH: 1,
-        RiskSeverity.MEDIUM: 2,
-        RiskSeverity.LOW: 3,
-    }
-    risks.sort(key=lambda r: severity_order.get(r.severity, 99))
+    risks.sort(key=lambda r: SEVERITY_ORDER[r.severity])
 
     return risks
 
@@ -118,7 +135,7 @@ def detect_dependencies(project: Project) -> list[Risk]:
 
 def _is_active(task: Task) -> bool:
     """Check if task is still in an active state."""
-    return task.status.strip().lower() in ACTIVE_STATUSES
+    return task.status_norm in ACTIVE_STATUSES
 
 
 def _find_dependency_matches(task: Task) -> list[dict[str, str]]:
@@ -130,33 +147,19 @@ def _find_dependency_matches(task: Task) -> list[dict[str, str]]:
     if not task.comments:
         return []
 
-    comments_lower = task.comments.lower()
     matches: list[dict[str, str]] = []
-    seen_positions: set[int] = set()  # Avoid duplicate matches at same position
-
-    for keyword in DEPENDENCY_KEYWORDS:
-        pos = 0
-        while True:
-            pos = comments_lower.find(keyword, pos)
-            if pos == -1:
-                break
-
-            # Skip if we've already matched at this position (overlapping keywords)
-            if pos in seen_positions:
-                pos += 1
-                continue
 
-            seen_positions.add(pos)
+    # Matches come back in text order and never overlap
+    for m in _DEPENDENCY_RE.finditer(task.comments_lower):
+        keyword = m.group()
 
-            # Extract context: the rest of the sentence after the keyword
-            context = _extract_context(task.comments, pos, keyword)
+        # Extract context: the rest of the sentence after the keyword
+        context = _extract_context(task.comments, m.start(), keyword)
 
-            matches.append({
-                "keyword": keyword,
-                "context": context,
-            })
-
-            pos += len(keyword)
+        matches.append({
+            "keyword": keyword,
+            "context": context,
+        })
 
     return matches
 
@@ -168,16 +171,10 @@ def _extract_context(text: str, keyword_pos: int, keyword: str) -> str:
     """
     after_keyword = text[keyword_pos + len(keyword):].strip()
 
-    # Take up to the next sentence boundary or 80 chars
-    end_markers = [". ", ".\n", "\n", ";", ","]
-    end_pos = len(after_keyword)
-
-    for marker in end_markers:
-        idx = after_keyword.find(marker)
-        if idx != -1 and idx < end_pos:
-            end_pos = idx
-
-    context = after_keyword[:min(end_pos, 80)].strip()
+    # Take up to the next sentence boundary or 80 chars; a boundary can
+    # only shorten the context if it starts within the first 80 chars
+    m = _CONTEXT_END_RE.search(after_keyword, 0, 81)
+    context = after_keyword[:m.start() if m else 80].strip()
 
     # Clean up leading punctuation/whitespace
     context = context.lstrip(":- ")
@@ -192,49 +189,47 @@ def _extract_context(text: str, keyword_pos: int, keyword: str) -> str:
 
 def _calculate_severity(task: Task, dep_count: int) -> RiskSeverity:
     """Calculate severity from task priority and dependency count."""
-    base = PRIORITY_SEVERITY.get(task.priority.strip().lower(), RiskSeverity.MEDIUM)
+    base = PRIORITY_SEVERITY.get(task.priority_norm, RiskSeverity.MEDIUM)
 
     # Elevate if multiple dependencies
     if dep_count >= 3:
-        elevation = {
-            RiskSeverity.LOW: RiskSeverity.HIGH,
-            RiskSeverity.MEDIUM: RiskSeverity.HIGH,
-            RiskSeverity.HIGH: RiskSeverity.CRITICAL,
-            RiskSeverity.CRITICAL: RiskSeverity.CRITICAL,
-        }
-        return elevation[base]
+        return _ELEVATE_DEP3[base]
     elif dep_count >= 2:
-        elevation = {
-            RiskSeverity.LOW: RiskSeverity.MEDIUM,
-            RiskSeverity.MEDIUM: RiskSeverity.HIGH,
-            RiskSeverity.HIGH: RiskSeverity.CRITICAL,
-            RiskSeverity.CRITICAL: RiskSeverity.CRITICAL,
-        }
-        return elevation[base]
+        return _ELEVATE_DEP2[base]
 
     return base
 
 
-def _build_mitigation(task: Task, matches: list[dict[str, str]], dep_count: int) -> str:
+# Mitigation clauses, in the order they are joined
+_MULTIPLE_CLAUSE = (
+    "Task '{task_name}' has {dep_count} dependencies — review whether "
+    "all are genuine blockers or if any can be decoupled. "
+    "Assign an owner to each dependency for resolution tracking."
+)
+_SINGLE_CLAUSE = (
+    "Confirm the dependency status for '{task_name}': {context}. "
+    "Identify the owner and agree a resolution date."
+)
+_PRIORITY_CLAUSE = (
+    "As a {priority}-priority item, unresolved dependencies "
+    "should be escalated to the project lead."
+)
+
+# One template per (single dependency, high priority) bit pattern
+_MITIGATION_TEMPLATES: tuple[str, ...] = (
+    _MULTIPLE_CLAUSE,
+    " ".join((_MULTIPLE_CLAUSE, _PRIORITY_CLAUSE)),
+    _SINGLE_CLAUSE,
+    " ".join((_SINGLE_CLAUSE, _PRIORITY_CLAUSE)),
+)
+
+
+def _build_mitigation(task: Task, matches: list[dict[str, str]], dep_count: int, priority_lower: str) -> str:
     """Build mitigation suggestion."""
-    parts: list[str] = []
-
-    if dep_count == 1:
-        parts.append(
-            f"Confirm the dependency status for '{task.name}': {matches[0]['context']}. "
-            f"Identify the owner and agree a resolution date."
-        )
-    else:
-        parts.append(
-            f"Task '{task.name}' has {dep_count} dependencies — review whether "
-            f"all are genuine blockers or if any can be decoupled. "
-            f"Assign an owner to each dependency for resolution tracking."
-        )
-
-    if task.priority.lower() in ("critical", "high"):
-        parts.append(
-            f"As a {task.priority.lower()}-priority item, unresolved dependencies "
-            f"should be escalated to the project lead."
-        )
-
-    return " ".join(parts)
+    flag = ((dep_count == 1) << 1) | (priority_lower in _HIGH_PRIORITIES)
+    return _MITIGATION_TEMPLATES[flag].format_map({
+        "task_name": task.name,
+        "context": matches[0]["context"],
+        "dep_count": dep_count,
+        "priority": priority_lower,
+    })
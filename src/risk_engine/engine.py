@@ -9,9 +9,12 @@ Sprint 1 — Week 3 deliverable.
 
 from __future__ import annotations
 
+import heapq
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
+from functools import cached_property
 
 from src.ingestion.parser import Project
 
@@ -38,8 +41,19 @@ SEVERITY_ORDER = {
     RiskSeverity.LOW: 3,
 }
 
+# Severities indexed by SEVERITY_ORDER (worst first)
+SEVERITIES_BY_ORDER: tuple[RiskSeverity, ...] = tuple(sorted(SEVERITY_ORDER, key=SEVERITY_ORDER.get))
 
-@dataclass
+# RAG status for a top severity: Critical/High → Red, Medium → Amber, Low → Green
+_RAG_MAP: dict[RiskSeverity, str] = {
+    RiskSeverity.CRITICAL: "Red",
+    RiskSeverity.HIGH: "Red",
+    RiskSeverity.MEDIUM: "Amber",
+    RiskSeverity.LOW: "Green",
+}
+
+
+@dataclass(slots=True)
 class Risk:
     """A single identified risk."""
 
@@ -72,6 +86,11 @@ class ProjectRiskSummary:
     top_severity: RiskSeverity
     risks: list[Risk] = field(default_factory=list)
 
+    @cached_property
+    def name_lower(self) -> str:
+        """Lowercase project name, computed once for case-insensitive matching."""
+        return self.project_name.lower()
+
     @property
     def rag_status(self) -> str:
         """Derive RAG (Red/Amber/Green) from top severity.
@@ -81,13 +100,7 @@ class ProjectRiskSummary:
         """
         if self.risk_count == 0:
             return "Green"
-        mapping = {
-            RiskSeverity.CRITICAL: "Red",
-            RiskSeverity.HIGH: "Red",
-            RiskSeverity.MEDIUM: "Amber",
-            RiskSeverity.LOW: "Green",
-        }
-        return mapping.get(self.top_severity, "Green")
+        return _RAG_MAP.get(self.top_severity, "Green")
 
     def to_dict(self) -> dict:
         return {
@@ -100,7 +113,7 @@ class ProjectRiskSummary:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioRiskReport:
     """Full portfolio risk analysis output."""
 
@@ -122,6 +135,7 @@ def analyse_portfolio(
     projects: list[Project],
     top_n: int = 5,
     reference_date: date | None = None,
+    max_workers: int | None = None,
 ) -> PortfolioRiskReport:
     """Run all risk detectors and return top N risks per project.
 
@@ -129,65 +143,43 @@ def analyse_portfolio(
         projects: List of parsed Project objects.
         top_n: Number of top risks to return per project.
         reference_date: Date for burn rate calculation (defaults to today).
+        max_workers: If greater than 1, run the per-project detectors in up
+            to this many worker processes. Defaults to in-process.
 
     Returns:
         PortfolioRiskReport with per-project summaries and portfolio-level metrics.
     """
     # Import detectors here to avoid circular imports
-    from src.risk_engine.blocked import detect_blocked_work
-    from src.risk_engine.burnrate import detect_burn_rate
-    from src.risk_engine.carryover import detect_carryover
-    from src.risk_engine.dependencies import detect_dependencies
+    from src.risk_engine.burnrate import detect_burn_rate_batch
 
-    summaries: list[ProjectRiskSummary] = []
     total_risks = 0
     projects_at_risk = 0
     worst_severity = RiskSeverity.LOW
 
-    for project in projects:
-        # Run all detectors
-        all_risks: list[Risk] = []
-        all_risks.extend(detect_blocked_work(project))
-        all_risks.extend(detect_carryover(project))
-        all_risks.extend(detect_burn_rate(project, reference_date=reference_date))
-        all_risks.extend(detect_dependencies(project))
-
-        # Sort by severity and take top N
-        all_risks.sort(key=lambda r: SEVERITY_ORDER.get(r.severity, 99))
-        top_risks = all_risks[:top_n]
-
-        # Determine top severity for this project
-        if top_risks:
-            top_severity = top_risks[0].severity
-        else:
-            top_severity = RiskSeverity.LOW
-
-        summary = ProjectRiskSummary(
-            project_name=project.name,
-            project_status=project.status,
-            risk_count=len(top_risks),
-            top_severity=top_severity,
-            risks=top_risks,
-        )
-        summaries.append(summary)
-
-        total_risks += len(top_risks)
-        if top_risks:
+    # Burn rate is numeric-only, so it runs once across the whole portfolio
+    burn_rate_risks = detect_burn_rate_batch(projects, reference_date=reference_date)
+    top_ns = [top_n] * len(projects)
+
+    if max_workers is not None and max_workers > 1 and len(projects) > 1:
+        # The detectors are pure Python and hold the GIL, so use processes
+        workers = min(len(projects), max_workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            summaries = list(executor.map(_analyse_project, projects, burn_rate_risks, top_ns))
+    else:
+        summaries = list(map(_analyse_project, projects, burn_rate_risks, top_ns))
+
+    for summary in summaries:
+        total_risks += summary.risk_count
+        if summary.risks:
             projects_at_risk += 1
-            if SEVERITY_ORDER[top_severity] < SEVERITY_ORDER[worst_severity]:
-                worst_severity = top_severity
+            if SEVERITY_ORDER[summary.top_severity] < SEVERITY_ORDER[worst_severity]:
+                worst_severity = summary.top_severity
 
     # Portfolio-level RAG
     if projects_at_risk == 0:
         portfolio_rag = "Green"
     else:
-        rag_map = {
-            RiskSeverity.CRITICAL: "Red",
-            RiskSeverity.HIGH: "Red",
-            RiskSeverity.MEDIUM: "Amber",
-            RiskSeverity.LOW: "Green",
-        }
-        portfolio_rag = rag_map.get(worst_severity, "Green")
+        portfolio_rag = _RAG_MAP.get(worst_severity, "Green")
 
     # Sort summaries: worst first
     summaries.sort(key=lambda s: SEVERITY_ORDER.get(s.top_severity, 99))
@@ -198,3 +190,35 @@ def analyse_portfolio(
         projects_at_risk=projects_at_risk,
         portfolio_rag=portfolio_rag,
     )
+
+
+def _analyse_project(project: Project, burn_risks: list[Risk], top_n: int) -> ProjectRiskSummary:
+    """Run the per-project detectors and keep the top N risks."""
+    # Import detectors here to avoid circular imports
+    from src.risk_engine.blocked import detect_blocked_work
+    from src.risk_engine.carryover import detect_carryover
+    from src.risk_engine.dependencies import detect_dependencies
+
+    # Run all detectors
+    all_risks: list[Risk] = []
+    all_risks.extend(detect_blocked_work(project))
+    all_risks.extend(detect_carryover(project))
+    all_risks.extend(burn_risks)
+    all_risks.extend(detect_dependencies(project))
+
+    # Top N by severity; ties keep detector order, as a stable sort would
+    top_risks = heapq.nsmallest(top_n, all_risks, key=lambda r: SEVERITY_ORDER[r.severity])
+
+    # Determine top severity for this project
+    if top_risks:
+        top_severity = top_risks[0].severity
+    else:
+        top_severity = RiskSeverity.LOW
+
+    return ProjectRiskSummary(
+        project_name=project.name,
+        project_status=project.status,
+        risk_count=len(top_risks),
+        top_severity=top_severity,
+        risks=top_risks,
+    )
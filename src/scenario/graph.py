@@ -10,6 +10,7 @@ Sprint 2 — Week 4 deliverable.
 from __future__ import annotations
 
 import re
+from collections import deque
 from dataclasses import dataclass, field
 
 from src.ingestion.parser import Project
@@ -27,6 +28,11 @@ CROSS_PROJECT_KEYWORDS = [
     "prerequisite",
 ]
 
+# All CROSS_PROJECT_KEYWORDS as one alternation (longest first), scanned in a single pass
+_CROSS_PROJECT_RE = re.compile(
+    "|".join(map(re.escape, sorted(CROSS_PROJECT_KEYWORDS, key=len, reverse=True)))
+)
+
 
 @dataclass
 class DependencyGraph:
@@ -38,12 +44,23 @@ class DependencyGraph:
 
     edges: dict[str, set[str]] = field(default_factory=dict)
     all_projects: set[str] = field(default_factory=set)
+    # Reverse of edges: project name → set of project names that depend on it
+    _reverse: dict[str, set[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # get_all_dependents results by project, cleared whenever an edge is added
+    _dependents_cache: dict[str, frozenset[str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for project, deps in self.edges.items():
+            for dep in deps:
+                self._reverse.setdefault(dep, set()).add(project)
 
     def add_dependency(self, project: str, depends_on: str) -> None:
         """Add a dependency: 'project' depends on 'depends_on'."""
         if project not in self.edges:
             self.edges[project] = set()
         self.edges[project].add(depends_on)
+        self._reverse.setdefault(depends_on, set()).add(project)
+        self._dependents_cache.clear()
 
     def get_dependencies(self, project: str) -> set[str]:
         """Get direct dependencies of a project."""
@@ -51,33 +68,33 @@ class DependencyGraph:
 
     def get_dependents(self, project: str) -> set[str]:
         """Get projects that depend on the given project (reverse lookup)."""
-        dependents = set()
-        for proj, deps in self.edges.items():
-            if project in deps:
-                dependents.add(proj)
-        return dependents
+        return self._reverse.get(project, set()).copy()
 
     def get_all_dependents(self, project: str) -> set[str]:
         """Get all projects that depend on the given project (transitive, downstream).
 
         Returns all projects that would be affected if this project slips.
+        The traversal is cached per project until the next add_dependency().
         """
-        visited: set[str] = set()
-        queue = [project]
-        while queue:
-            current = queue.pop(0)
-            for proj, deps in self.edges.items():
-                if current in deps and proj not in visited:
-                    visited.add(proj)
-                    queue.append(proj)
-        return visited
+        cached = self._dependents_cache.get(project)
+        if cached is None:
+            visited: set[str] = set(self._reverse.get(project, ()))
+            queue = deque(visited)
+            while queue:
+                current = queue.popleft()
+                for proj in self._reverse.get(current, ()):
+                    if proj not in visited:
+                        visited.add(proj)
+                        queue.append(proj)
+            cached = self._dependents_cache[project] = frozenset(visited)
+        return set(cached)
 
     def get_all_dependencies(self, project: str) -> set[str]:
         """Get all projects that the given project depends on (transitive, upstream)."""
         visited: set[str] = set()
-        queue = list(self.get_dependencies(project))
+        queue = deque(self.get_dependencies(project))
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if current not in visited:
                 visited.add(current)
                 queue.extend(self.get_dependencies(current) - visited)
@@ -90,36 +107,39 @@ class DependencyGraph:
             A list of project names forming a cycle, or None if no cycle found.
         """
         WHITE, GRAY, BLACK = 0, 1, 2
-        colour: dict[str, int] = {p: WHITE for p in self.all_projects}
-        parent: dict[str, str | None] = {p: None for p in self.all_projects}
-
-        def dfs(node: str) -> list[str] | None:
-            colour[node] = GRAY
-            for dep in self.edges.get(node, set()):
-                if dep not in colour:
-                    continue
-                if colour[dep] == GRAY:
-                    # Found cycle — reconstruct path
-                    cycle = [dep, node]
-                    current = node
-                    while parent.get(current) and parent[current] != dep:
-                        current = parent[current]
-                        cycle.append(current)
-                    cycle.append(dep)
-                    return list(reversed(cycle))
-                if colour[dep] == WHITE:
-                    parent[dep] = node
-                    result = dfs(dep)
-                    if result:
-                        return result
-            colour[node] = BLACK
-            return None
-
-        for project in self.all_projects:
-            if colour.get(project, WHITE) == WHITE:
-                result = dfs(project)
-                if result:
-                    return result
+        nodes = list(self.all_projects)
+        index = {name: i for i, name in enumerate(nodes)}
+        # Adjacency by node index, dropping edges to projects outside the graph
+        adj = [[index[dep] for dep in self.edges.get(name, ()) if dep in index] for name in nodes]
+        colour = bytearray(len(nodes))
+        parent = [-1] * len(nodes)
+
+        for start in range(len(nodes)):
+            if colour[start] != WHITE:
+                continue
+            colour[start] = GRAY
+            # Explicit DFS stack of (node, remaining deps) instead of recursion
+            stack = [(start, iter(adj[start]))]
+            while stack:
+                node, deps = stack[-1]
+                for dep in deps:
+                    if colour[dep] == GRAY:
+                        # Found cycle — reconstruct path
+                        cycle = [dep, node]
+                        current = node
+                        while parent[current] != -1 and parent[current] != dep:
+                            current = parent[current]
+                            cycle.append(current)
+                        cycle.append(dep)
+                        return [nodes[i] for i in reversed(cycle)]
+                    if colour[dep] == WHITE:
+                        parent[dep] = node
+                        colour[dep] = GRAY
+                        stack.append((dep, iter(adj[dep])))
+                        break
+                else:
+                    colour[node] = BLACK
+                    stack.pop()
         return None
 
     def to_dict(self) -> dict:
@@ -155,7 +175,7 @@ def build_dependency_graph(projects: list[Project]) -> DependencyGraph:
                 continue
 
             # Find cross-project dependency mentions
-            mentioned = _find_project_mentions(task.comments, name_lookup, project.name)
+            mentioned = _find_project_mentions(task.comments_lower, name_lookup, project.name)
             for dep_name in mentioned:
                 graph.add_dependency(project.name, dep_name)
 
@@ -163,40 +183,31 @@ def build_dependency_graph(projects: list[Project]) -> DependencyGraph:
 
 
 def _find_project_mentions(
-    comments: str,
+    comments_lower: str,
     name_lookup: dict[str, str],
     current_project: str,
 ) -> set[str]:
     """Find other project names mentioned after dependency keywords in comments.
 
+    Args:
+        comments_lower: Lowercased task comments (Task.comments_lower).
+
     Returns:
         Set of project names that this task depends on.
     """
     mentioned: set[str] = set()
-    comments_lower = comments.lower()
-
-    for keyword in CROSS_PROJECT_KEYWORDS:
-        pos = 0
-        while True:
-            pos = comments_lower.find(keyword, pos)
-            if pos == -1:
-                break
-
-            # Extract text after the keyword (up to sentence boundary)
-            after = comments[pos + len(keyword):].strip()
-            after = after.lstrip(":- ")
-
-            # Look for a project name in the text after the keyword
-            after_lower = after.lower()
-            for name_lower, name_original in name_lookup.items():
-                if name_original == current_project:
-                    continue  # Skip self-references
-
-                # Check if project name appears near the keyword
-                name_pos = after_lower.find(name_lower)
-                if name_pos != -1 and name_pos < 80:  # Within reasonable distance
-                    mentioned.add(name_original)
-
-            pos += len(keyword)
+
+    # Skip self-references once, not per keyword match
+    candidates = [(name_lower, name) for name_lower, name in name_lookup.items() if name != current_project]
+
+    for m in _CROSS_PROJECT_RE.finditer(comments_lower):
+        # Extract text after the keyword (up to sentence boundary)
+        after_lower = comments_lower[m.end():].strip()
+        after_lower = after_lower.lstrip(":- ")
+
+        # Look for a project name starting within 80 chars of the keyword
+        for name_lower, name_original in candidates:
+            if after_lower.find(name_lower, 0, 79 + len(name_lower)) != -1:
+                mentioned.add(name_original)
 
     return mentioned
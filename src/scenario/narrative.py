@@ -10,6 +10,7 @@ Sprint 2 — Week 6 deliverable.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 
 from src.scenario.parser import ActionType, ScenarioAction
@@ -32,22 +33,25 @@ class ScenarioNarrative:
     @property
     def full_text(self) -> str:
         """Render the full narrative as plain text."""
-        sections = [
-            f"# Scenario Impact Summary\n",
-            f"## Scenario\n{self.scenario_description}\n",
-            f"## Before\n{self.before_summary}\n",
-            f"## After\n{self.after_summary}\n",
-            f"## Impact Analysis\n{self.impact_analysis}\n",
+        # One line per entry; the "" entries become the blank line after each section
+        parts = [
+            "# Scenario Impact Summary", "",
+            "## Scenario", self.scenario_description, "",
+            "## Before", self.before_summary, "",
+            "## After", self.after_summary, "",
+            "## Impact Analysis", self.impact_analysis, "",
         ]
         if self.cascade_analysis:
-            sections.append(f"## Cascade Effects\n{self.cascade_analysis}\n")
+            parts.extend(("## Cascade Effects", self.cascade_analysis, ""))
         if self.recommendations:
-            rec_text = "\n".join(f"- {r}" for r in self.recommendations)
-            sections.append(f"## Recommended Actions\n{rec_text}\n")
+            parts.append("## Recommended Actions")
+            parts.extend(["- " + r for r in self.recommendations])
+            parts.append("")
         if self.warnings:
-            warn_text = "\n".join(f"- {w}" for w in self.warnings)
-            sections.append(f"## Warnings\n{warn_text}\n")
-        return "\n".join(sections)
+            parts.append("## Warnings")
+            parts.extend(["- " + w for w in self.warnings])
+            parts.append("")
+        return "\n".join(parts)
 
     def to_dict(self) -> dict:
         return {
@@ -80,8 +84,13 @@ def generate_narrative(result: ScenarioResult) -> ScenarioNarrative:
     narrative.scenario_description = _build_description(action)
 
     # Before/after summaries
-    direct_impacts = [i for i in result.impacts if i.impact_type == "direct"]
-    cascade_impacts = [i for i in result.impacts if i.impact_type == "cascade"]
+    direct_impacts: list[ProjectImpact] = []
+    cascade_impacts: list[ProjectImpact] = []
+    for impact in result.impacts:
+        if impact.impact_type == "direct":
+            direct_impacts.append(impact)
+        elif impact.impact_type == "cascade":
+            cascade_impacts.append(impact)
 
     narrative.before_summary = _build_before_summary(action, result.before_state)
     narrative.after_summary = _build_after_summary(action, direct_impacts, result.after_state)
@@ -90,7 +99,7 @@ def generate_narrative(result: ScenarioResult) -> ScenarioNarrative:
     if cascade_impacts:
         narrative.cascade_analysis = _build_cascade_analysis(action, cascade_impacts)
 
-    narrative.recommendations = _build_recommendations(action, result)
+    narrative.recommendations = _build_recommendations(action, result, len(cascade_impacts))
     narrative.warnings = result.warnings
 
     return narrative
@@ -102,56 +111,88 @@ def generate_narrative(result: ScenarioResult) -> ScenarioNarrative:
 
 
 def _build_title(action: ScenarioAction) -> str:
-    labels = {
-        ActionType.BUDGET_INCREASE: f"Budget Increase: {action.project}",
-        ActionType.BUDGET_DECREASE: f"Budget Decrease: {action.project}",
-        ActionType.SCOPE_CUT: f"Scope Reduction: {action.project}",
-        ActionType.DELAY: f"Schedule Delay: {action.project}",
-        ActionType.REMOVE: f"Project Removal: {action.project}",
-    }
-    return labels.get(action.action, f"Scenario: {action.project}")
+    label = _TITLE_LABELS.get(action.action, "Scenario")
+    return f"{label}: {action.project}"
 
 
 def _build_description(action: ScenarioAction) -> str:
     if action.description:
         return action.description
 
-    descs = {
-        ActionType.BUDGET_INCREASE: f"Increase {action.project} budget by {action.amount:.0%}" if action.amount else f"Increase {action.project} budget by {action.amount_absolute:,.0f}",
-        ActionType.BUDGET_DECREASE: f"Decrease {action.project} budget by {action.amount:.0%}" if action.amount else f"Decrease {action.project} budget by {action.amount_absolute:,.0f}",
-        ActionType.SCOPE_CUT: f"Cut {action.project} scope by {action.amount:.0%}",
-        ActionType.DELAY: f"Delay {action.project} by {action.duration_weeks} weeks",
-        ActionType.REMOVE: f"Remove {action.project} from portfolio",
-    }
-    return descs.get(action.action, str(action))
+    # Budget changes without a percentage were given as an absolute amount
+    template = None if action.amount else _ABSOLUTE_DESCRIPTION_TEMPLATES.get(action.action)
+    if template is None:
+        template = _DESCRIPTION_TEMPLATES.get(action.action)
+    if template is None:
+        return str(action)
+    return template.format(
+        project=action.project,
+        amount=action.amount,
+        amount_absolute=action.amount_absolute,
+        duration_weeks=action.duration_weeks,
+    )
+
+
+_TITLE_LABELS: dict[ActionType, str] = {
+    ActionType.BUDGET_INCREASE: "Budget Increase",
+    ActionType.BUDGET_DECREASE: "Budget Decrease",
+    ActionType.SCOPE_CUT: "Scope Reduction",
+    ActionType.DELAY: "Schedule Delay",
+    ActionType.REMOVE: "Project Removal",
+}
+
+_DESCRIPTION_TEMPLATES: dict[ActionType, str] = {
+    ActionType.BUDGET_INCREASE: "Increase {project} budget by {amount:.0%}",
+    ActionType.BUDGET_DECREASE: "Decrease {project} budget by {amount:.0%}",
+    ActionType.SCOPE_CUT: "Cut {project} scope by {amount:.0%}",
+    ActionType.DELAY: "Delay {project} by {duration_weeks} weeks",
+    ActionType.REMOVE: "Remove {project} from portfolio",
+}
+
+_ABSOLUTE_DESCRIPTION_TEMPLATES: dict[ActionType, str] = {
+    ActionType.BUDGET_INCREASE: "Increase {project} budget by {amount_absolute:,.0f}",
+    ActionType.BUDGET_DECREASE: "Decrease {project} budget by {amount_absolute:,.0f}",
+}
 
 
 def _build_before_summary(action: ScenarioAction, before: dict[str, dict]) -> str:
     project = action.project
-    state = before.get(project, {})
+    state = before.get(project)
     if not state:
         return f"{project}: No data available."
 
-    parts = [f"{project} is currently {state.get('status', 'unknown status')}."]
+    get = state.get
+    parts = [f"{project} is currently {get('status', 'unknown status')}."]
 
-    budget = state.get("budget", 0)
-    spend = state.get("actual_spend", 0)
+    budget = get("budget", 0)
     if budget > 0:
+        spend = get("actual_spend", 0)
         pct = (spend / budget) * 100
         parts.append(f"Budget: {budget:,.0f} ({pct:.0f}% consumed, {spend:,.0f} spent).")
 
-    start = state.get("start_date")
-    end = state.get("end_date")
-    if start and end:
-        parts.append(f"Timeline: {start} to {end}.")
+    start = get("start_date")
+    if start:
+        end = get("end_date")
+        if end:
+            parts.append(f"Timeline: {start} to {end}.")
 
-    tasks = state.get("task_count", 0)
+    tasks = get("task_count", 0)
     if tasks > 0:
         parts.append(f"{tasks} tasks in progress.")
 
     return " ".join(parts)
 
 
+# Display labels for the change keys the simulator emits ("end_date" → "End Date")
+_FIELD_LABELS: dict[str, str] = {
+    name: name.replace("_", " ").title()
+    for name in (
+        "budget", "runway_weeks", "scope", "start_date", "end_date", "days_saved", "delay_weeks",
+        "status", "budget_freed", "remaining_budget", "note", "reason",
+    )
+}
+
+
 def _build_after_summary(
     action: ScenarioAction,
     direct_impacts: list[ProjectImpact],
@@ -164,7 +205,7 @@ def _build_after_summary(
     parts = []
 
     for field_name, change_desc in impact.changes.items():
-        label = field_name.replace("_", " ").title()
+        label = _FIELD_LABELS.get(field_name) or field_name.replace("_", " ").title()
         parts.append(f"{label}: {change_desc}.")
 
     return " ".join(parts)
@@ -174,49 +215,72 @@ def _build_impact_analysis(action: ScenarioAction, direct_impacts: list[ProjectI
     if not direct_impacts:
         return "No measurable impact."
 
-    impact = direct_impacts[0]
+    builder = _IMPACT_BUILDERS.get(action.action)
+    if builder is None:
+        return "Impact analysis not available for this scenario type."
+    return builder(action, direct_impacts[0])
+
+
+def _impact_budget_increase(action: ScenarioAction, impact: ProjectImpact) -> str:
+    project = impact.project_name
+    return (
+        f"Increasing the budget for {project} extends the financial runway, "
+        f"reducing the risk of budget exhaustion before delivery. "
+        f"This may allow the team to address scope or resource constraints "
+        f"that are currently limiting progress."
+    )
+
+
+def _impact_budget_decrease(action: ScenarioAction, impact: ProjectImpact) -> str:
+    project = impact.project_name
+    return (
+        f"Decreasing the budget for {project} shortens the financial runway. "
+        f"The team may need to reduce scope or find efficiencies to deliver "
+        f"within the revised budget. Review whether current commitments "
+        f"are achievable with reduced funding."
+    )
+
+
+def _impact_scope_cut(action: ScenarioAction, impact: ProjectImpact) -> str:
+    project = impact.project_name
+    days = impact.changes.get("days_saved", "0")
+    return (
+        f"Reducing scope on {project} by {action.amount:.0%} "
+        f"is estimated to save {days} days on the delivery timeline. "
+        f"This trades feature completeness for earlier delivery. "
+        f"Review which deliverables are deferred and whether benefits "
+        f"targets are still achievable with reduced scope."
+    )
+
+
+def _impact_delay(action: ScenarioAction, impact: ProjectImpact) -> str:
+    project = impact.project_name
+    weeks = action.duration_weeks
+    return (
+        f"Delaying {project} by {weeks} week{'s' if weeks > 1 else ''} "
+        f"shifts the delivery window forward. "
+        f"This may impact dependent projects and downstream milestones. "
+        f"Benefits realisation will be correspondingly delayed."
+    )
+
+
+def _impact_remove(action: ScenarioAction, impact: ProjectImpact) -> str:
     project = impact.project_name
+    return (
+        f"Removing {project} from the portfolio frees up budget and resources. "
+        f"However, any projects dependent on {project} will need "
+        f"re-planning or alternative delivery paths. "
+        f"Expected benefits from {project} will not be realised."
+    )
+
 
-    if action.action == ActionType.BUDGET_INCREASE:
-        return (
-            f"Increasing the budget for {project} extends the financial runway, "
-            f"reducing the risk of budget exhaustion before delivery. "
-            f"This may allow the team to address scope or resource constraints "
-            f"that are currently limiting progress."
-        )
-    elif action.action == ActionType.BUDGET_DECREASE:
-        return (
-            f"Decreasing the budget for {project} shortens the financial runway. "
-            f"The team may need to reduce scope or find efficiencies to deliver "
-            f"within the revised budget. Review whether current commitments "
-            f"are achievable with reduced funding."
-        )
-    elif action.action == ActionType.SCOPE_CUT:
-        days = impact.changes.get("days_saved", "0")
-        return (
-            f"Reducing scope on {project} by {action.amount:.0%} "
-            f"is estimated to save {days} days on the delivery timeline. "
-            f"This trades feature completeness for earlier delivery. "
-            f"Review which deliverables are deferred and whether benefits "
-            f"targets are still achievable with reduced scope."
-        )
-    elif action.action == ActionType.DELAY:
-        weeks = action.duration_weeks
-        return (
-            f"Delaying {project} by {weeks} week{'s' if weeks > 1 else ''} "
-            f"shifts the delivery window forward. "
-            f"This may impact dependent projects and downstream milestones. "
-            f"Benefits realisation will be correspondingly delayed."
-        )
-    elif action.action == ActionType.REMOVE:
-        return (
-            f"Removing {project} from the portfolio frees up budget and resources. "
-            f"However, any projects dependent on {project} will need "
-            f"re-planning or alternative delivery paths. "
-            f"Expected benefits from {project} will not be realised."
-        )
-
-    return "Impact analysis not available for this scenario type."
+_IMPACT_BUILDERS: dict[ActionType, Callable[[ScenarioAction, ProjectImpact], str]] = {
+    ActionType.BUDGET_INCREASE: _impact_budget_increase,
+    ActionType.BUDGET_DECREASE: _impact_budget_decrease,
+    ActionType.SCOPE_CUT: _impact_scope_cut,
+    ActionType.DELAY: _impact_delay,
+    ActionType.REMOVE: _impact_remove,
+}
 
 
 def _build_cascade_analysis(action: ScenarioAction, cascade_impacts: list[ProjectImpact]) -> str:
@@ -242,37 +306,62 @@ def _build_cascade_analysis(action: ScenarioAction, cascade_impacts: list[Projec
     return "\n".join(parts)
 
 
-def _build_recommendations(action: ScenarioAction, result: ScenarioResult) -> list[str]:
-    recs: list[str] = []
-    project = action.project
-    cascade_count = sum(1 for i in result.impacts if i.impact_type == "cascade")
-
-    if action.action == ActionType.BUDGET_INCREASE:
-        recs.append(f"Approve the budget increase for {project} and communicate the revised allocation to the delivery team.")
-        recs.append(f"Set a checkpoint in 4 weeks to verify the additional funding is translating into accelerated delivery.")
-
-    elif action.action == ActionType.BUDGET_DECREASE:
-        recs.append(f"Confirm the revised budget with the {project} delivery team and agree scope trade-offs.")
-        recs.append(f"Identify which deliverables can be deferred to Phase 2 to fit within the reduced budget.")
-        if any("over budget" in w.lower() for w in result.warnings):
-            recs.append(f"URGENT: {project} is already over budget — immediate intervention required.")
-
-    elif action.action == ActionType.SCOPE_CUT:
-        recs.append(f"Agree the deferred scope items with the {project} sponsor and update the benefits register.")
-        recs.append(f"Communicate the revised delivery date to stakeholders.")
-        if cascade_count > 0:
-            recs.append(f"Notify the {cascade_count} dependent project{'s' if cascade_count > 1 else ''} of the earlier delivery window.")
-
-    elif action.action == ActionType.DELAY:
-        recs.append(f"Communicate the revised timeline for {project} to all stakeholders.")
-        if cascade_count > 0:
-            recs.append(f"Assess the cascade impact on {cascade_count} dependent project{'s' if cascade_count > 1 else ''} and update their timelines.")
-        recs.append(f"Review whether the delay changes the cost profile (extended team costs, contract implications).")
-
-    elif action.action == ActionType.REMOVE:
-        recs.append(f"Formally close {project} and release resources back to the portfolio.")
-        recs.append(f"Update the benefits register to remove {project}'s expected benefits.")
-        if cascade_count > 0:
-            recs.append(f"Urgently re-plan the {cascade_count} project{'s' if cascade_count > 1 else ''} that depend on {project}.")
+def _build_recommendations(action: ScenarioAction, result: ScenarioResult, cascade_count: int) -> list[str]:
+    builder = _RECOMMENDATION_BUILDERS.get(action.action)
+    if builder is None:
+        return []
+    return builder(action.project, result, cascade_count)
+
+
+def _recs_budget_increase(project: str, result: ScenarioResult, cascade_count: int) -> list[str]:
+    return [
+        f"Approve the budget increase for {project} and communicate the revised allocation to the delivery team.",
+        "Set a checkpoint in 4 weeks to verify the additional funding is translating into accelerated delivery.",
+    ]
+
+
+def _recs_budget_decrease(project: str, result: ScenarioResult, cascade_count: int) -> list[str]:
+    recs = [
+        f"Confirm the revised budget with the {project} delivery team and agree scope trade-offs.",
+        "Identify which deliverables can be deferred to Phase 2 to fit within the reduced budget.",
+    ]
+    if any("over budget" in w.lower() for w in result.warnings):
+        recs.append(f"URGENT: {project} is already over budget — immediate intervention required.")
+    return recs
+
 
+def _recs_scope_cut(project: str, result: ScenarioResult, cascade_count: int) -> list[str]:
+    recs = [
+        f"Agree the deferred scope items with the {project} sponsor and update the benefits register.",
+        "Communicate the revised delivery date to stakeholders.",
+    ]
+    if cascade_count > 0:
+        recs.append(f"Notify the {cascade_count} dependent project{'s' if cascade_count > 1 else ''} of the earlier delivery window.")
     return recs
+
+
+def _recs_delay(project: str, result: ScenarioResult, cascade_count: int) -> list[str]:
+    recs = [f"Communicate the revised timeline for {project} to all stakeholders."]
+    if cascade_count > 0:
+        recs.append(f"Assess the cascade impact on {cascade_count} dependent project{'s' if cascade_count > 1 else ''} and update their timelines.")
+    recs.append("Review whether the delay changes the cost profile (extended team costs, contract implications).")
+    return recs
+
+
+def _recs_remove(project: str, result: ScenarioResult, cascade_count: int) -> list[str]:
+    recs = [
+        f"Formally close {project} and release resources back to the portfolio.",
+        f"Update the benefits register to remove {project}'s expected benefits.",
+    ]
+    if cascade_count > 0:
+        recs.append(f"Urgently re-plan the {cascade_count} project{'s' if cascade_count > 1 else ''} that depend on {project}.")
+    return recs
+
+
+_RECOMMENDATION_BUILDERS: dict[ActionType, Callable[[str, ScenarioResult, int], list[str]]] = {
+    ActionType.BUDGET_INCREASE: _recs_budget_increase,
+    ActionType.BUDGET_DECREASE: _recs_budget_decrease,
+    ActionType.SCOPE_CUT: _recs_scope_cut,
+    ActionType.DELAY: _recs_delay,
+    ActionType.REMOVE: _recs_remove,
+}
@@ -13,6 +13,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 
 class ActionType(Enum):
@@ -23,9 +24,9 @@ class ActionType(Enum):
     REMOVE = "remove"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScenarioAction:
-    """A parsed scenario action."""
+    """A parsed scenario action. Immutable, so parsed actions can be cached and shared."""
 
     action: ActionType
     project: str
@@ -58,6 +59,56 @@ DURATION_WEEKS = {
 }
 
 
+# ──────────────────────────────────────────────
+# Patterns
+# ──────────────────────────────────────────────
+
+_BUDGET_VERBS = r"(?P<verb>increase|decrease|reduce|raise|boost|lower)"
+_DURATION_UNITS = r"(?P<unit>week|weeks|month|months|quarter|quarters|year|years|fortnight|fortnights)"
+
+# (kind, pattern) in match priority order, matched case-insensitively.
+# Named groups: verb, project, amount, unit.
+_SCENARIO_PATTERNS: tuple[tuple[str, str], ...] = (
+    ("remove", r"(?:remove|cancel|drop|kill|delete)\s+(?:project\s+)?(?P<project>.+?)(?:\s+from\s+portfolio)?$"),
+    # Percentage-based: "increase project beta budget by 20%"
+    ("budget_pct", _BUDGET_VERBS + r"\s+(?:project\s+)?(?P<project>.+?)\s+budget\s+by\s+(?P<amount>\d+(?:\.\d+)?)\s*%"),
+    ("budget_pct", _BUDGET_VERBS + r"\s+(?:the\s+)?budget\s+(?:for|of|on)\s+(?:project\s+)?(?P<project>.+?)"
+                   r"\s+by\s+(?P<amount>\d+(?:\.\d+)?)\s*%"),
+    # Absolute amount: "increase project beta budget by £50,000"
+    ("budget_abs", _BUDGET_VERBS + r"\s+(?:project\s+)?(?P<project>.+?)\s+budget\s+by\s+[£$€]?\s*"
+                   r"(?P<amount>\d[\d,]*(?:\.\d+)?)"),
+    ("budget_abs", _BUDGET_VERBS + r"\s+(?:the\s+)?budget\s+(?:for|of|on)\s+(?:project\s+)?(?P<project>.+?)"
+                   r"\s+by\s+[£$€]?\s*(?P<amount>\d[\d,]*(?:\.\d+)?)"),
+    ("scope_cut", r"(?:cut|reduce|trim|shrink)\s+(?:project\s+)?(?P<project>.+?)\s+scope\s+by\s+"
+                  r"(?P<amount>\d+(?:\.\d+)?)\s*%"),
+    ("scope_cut", r"(?:cut|reduce|trim|shrink)\s+(?:the\s+)?scope\s+(?:for|of|on)\s+(?:project\s+)?(?P<project>.+?)"
+                  r"\s+by\s+(?P<amount>\d+(?:\.\d+)?)\s*%"),
+    ("delay", r"(?:delay|push back|postpone|defer|extend)\s+(?:project\s+)?(?P<project>.+?)\s+by\s+(?P<amount>\d+)\s+"
+              + _DURATION_UNITS),
+    ("delay", r"(?:delay|push back|postpone|defer|extend)\s+(?:project\s+)?(?P<project>.+?)\s+(?P<amount>\d+)\s+"
+              + _DURATION_UNITS),
+)
+
+
+def _compile_scenario_re(patterns: tuple[tuple[str, str], ...]) -> re.Pattern[str]:
+    """Join the patterns into one alternation, tried in order like separate matches.
+
+    Alternative i is wrapped in group "a<i>" and its named groups are
+    prefixed "a<i>_", since group names must be unique across the regex.
+    """
+    alternatives = []
+    for i, (_, pattern) in enumerate(patterns):
+        pattern = re.sub(r"\(\?P<(\w+)>", rf"(?P<a{i}_\1>", pattern)
+        alternatives.append(f"(?P<a{i}>{pattern})")
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
+_SCENARIO_RE = _compile_scenario_re(_SCENARIO_PATTERNS)
+
+# Outer group name → pattern kind
+_ALTERNATIVE_KINDS = {f"a{i}": kind for i, (kind, _) in enumerate(_SCENARIO_PATTERNS)}
+
+
 def parse_scenario(text: str) -> ScenarioAction:
     """Parse a natural language scenario into a ScenarioAction.
 
@@ -80,133 +131,66 @@ def parse_scenario(text: str) -> ScenarioAction:
     Raises:
         ParseError: If the input cannot be parsed.
     """
+    return _parse_scenario_cached(text)
+
+
+@lru_cache(maxsize=512)
+def _parse_scenario_cached(text: str) -> ScenarioAction:
+    """Parse a scenario; repeated inputs (presets, replays) are served from cache."""
     text = text.strip()
     if not text:
         raise ParseError("Empty scenario input.")
 
-    original = text
-    normalised = text.lower()
-
-    # Try each parser in order
-    parsers = [
-        _parse_remove,
-        _parse_budget_change,
-        _parse_scope_cut,
-        _parse_delay,
-    ]
-
-    for parser in parsers:
-        result = parser(normalised, original)
-        if result is not None:
-            result.description = original
-            return result
-
-    raise ParseError(
-        f"Could not parse scenario: '{text}'. "
-        f"Supported patterns: budget increase/decrease, scope cut, delay, remove."
-    )
-
-
-# ──────────────────────────────────────────────
-# Individual parsers
-# ──────────────────────────────────────────────
-
-
-def _parse_remove(normalised: str, original: str) -> ScenarioAction | None:
-    """Parse 'remove/cancel/drop Project X' patterns."""
-    patterns = [
-        r"(?:remove|cancel|drop|kill|delete)\s+(?:project\s+)?(.+?)(?:\s+from\s+portfolio)?$",
-    ]
-    for pattern in patterns:
-        match = re.match(pattern, normalised.strip())
-        if match:
-            project = _clean_project_name(match.group(1), original)
-            return ScenarioAction(
-                action=ActionType.REMOVE,
-                project=project,
-            )
-    return None
-
-
-def _parse_budget_change(normalised: str, original: str) -> ScenarioAction | None:
-    """Parse 'increase/decrease Project X budget by Y%' or 'by £Y' patterns."""
-    # Percentage-based: "increase project beta budget by 20%"
-    pct_patterns = [
-        r"(increase|decrease|reduce|raise|boost|lower)\s+(?:project\s+)?(.+?)\s+budget\s+by\s+(\d+(?:\.\d+)?)\s*%",
-        r"(increase|decrease|reduce|raise|boost|lower)\s+(?:the\s+)?budget\s+(?:for|of|on)\s+(?:project\s+)?(.+?)\s+by\s+(\d+(?:\.\d+)?)\s*%",
-    ]
-    for pattern in pct_patterns:
-        match = re.match(pattern, normalised.strip())
-        if match:
-            verb = match.group(1)
-            project = _clean_project_name(match.group(2), original)
-            pct = float(match.group(3)) / 100.0
-            action_type = ActionType.BUDGET_DECREASE if verb in ("decrease", "reduce", "lower") else ActionType.BUDGET_INCREASE
-            return ScenarioAction(
-                action=action_type,
-                project=project,
-                amount=pct,
-            )
-
-    # Absolute amount: "increase project beta budget by £50,000"
-    abs_patterns = [
-        r"(increase|decrease|reduce|raise|boost|lower)\s+(?:project\s+)?(.+?)\s+budget\s+by\s+[£$€]?\s*(\d[\d,]*(?:\.\d+)?)",
-        r"(increase|decrease|reduce|raise|boost|lower)\s+(?:the\s+)?budget\s+(?:for|of|on)\s+(?:project\s+)?(.+?)\s+by\s+[£$€]?\s*(\d[\d,]*(?:\.\d+)?)",
-    ]
-    for pattern in abs_patterns:
-        match = re.match(pattern, normalised.strip())
-        if match:
-            verb = match.group(1)
-            project = _clean_project_name(match.group(2), original)
-            amount = float(match.group(3).replace(",", ""))
-            action_type = ActionType.BUDGET_DECREASE if verb in ("decrease", "reduce", "lower") else ActionType.BUDGET_INCREASE
-            return ScenarioAction(
-                action=action_type,
-                project=project,
-                amount_absolute=amount,
-            )
-
-    return None
-
-
-def _parse_scope_cut(normalised: str, original: str) -> ScenarioAction | None:
-    """Parse 'cut/reduce Project X scope by Y%' patterns."""
-    patterns = [
-        r"(?:cut|reduce|trim|shrink)\s+(?:project\s+)?(.+?)\s+scope\s+by\s+(\d+(?:\.\d+)?)\s*%",
-        r"(?:cut|reduce|trim|shrink)\s+(?:the\s+)?scope\s+(?:for|of|on)\s+(?:project\s+)?(.+?)\s+by\s+(\d+(?:\.\d+)?)\s*%",
-    ]
-    for pattern in patterns:
-        match = re.match(pattern, normalised.strip())
-        if match:
-            project = _clean_project_name(match.group(1), original)
-            pct = float(match.group(2)) / 100.0
-            return ScenarioAction(
-                action=ActionType.SCOPE_CUT,
-                project=project,
-                amount=pct,
-            )
-    return None
-
-
-def _parse_delay(normalised: str, original: str) -> ScenarioAction | None:
-    """Parse 'delay Project X by N weeks/months/quarters' patterns."""
-    patterns = [
-        r"(?:delay|push back|postpone|defer|extend)\s+(?:project\s+)?(.+?)\s+by\s+(\d+)\s+(week|weeks|month|months|quarter|quarters|year|years|fortnight|fortnights)",
-        r"(?:delay|push back|postpone|defer|extend)\s+(?:project\s+)?(.+?)\s+(\d+)\s+(week|weeks|month|months|quarter|quarters|year|years|fortnight|fortnights)",
-    ]
-    for pattern in patterns:
-        match = re.match(pattern, normalised.strip())
-        if match:
-            project = _clean_project_name(match.group(1), original)
-            count = int(match.group(2))
-            unit = match.group(3).lower()
-            weeks_per_unit = DURATION_WEEKS.get(unit, 1)
-            return ScenarioAction(
-                action=ActionType.DELAY,
-                project=project,
-                duration_weeks=count * weeks_per_unit,
-            )
-    return None
+    # One pass over the input; the first matching alternative wins
+    match = _SCENARIO_RE.match(text)
+    if match is None:
+        raise ParseError(
+            f"Could not parse scenario: '{text}'. "
+            f"Supported patterns: budget increase/decrease, scope cut, delay, remove."
+        )
+
+    alternative = match.lastgroup
+    kind = _ALTERNATIVE_KINDS[alternative]
+    prefix = alternative + "_"
+    groups = {
+        name[len(prefix):]: value
+        for name, value in match.groupdict().items()
+        if name.startswith(prefix)
+    }
+    # Matched against the original text, so the project keeps its case
+    project = groups["project"].strip().rstrip("'\"").rstrip()
+
+    if kind == "remove":
+        return ScenarioAction(action=ActionType.REMOVE, project=project, description=text)
+    elif kind == "budget_pct":
+        return ScenarioAction(
+            action=_budget_action(groups["verb"].lower()),
+            project=project,
+            amount=float(groups["amount"]) / 100.0,
+            description=text,
+        )
+    elif kind == "budget_abs":
+        return ScenarioAction(
+            action=_budget_action(groups["verb"].lower()),
+            project=project,
+            amount_absolute=float(groups["amount"].replace(",", "")),
+            description=text,
+        )
+    elif kind == "scope_cut":
+        return ScenarioAction(
+            action=ActionType.SCOPE_CUT,
+            project=project,
+            amount=float(groups["amount"]) / 100.0,
+            description=text,
+        )
+    else:
+        weeks_per_unit = DURATION_WEEKS.get(groups["unit"].lower(), 1)
+        return ScenarioAction(
+            action=ActionType.DELAY,
+            project=project,
+            duration_weeks=int(groups["amount"]) * weeks_per_unit,
+            description=text,
+        )
 
 
 # ──────────────────────────────────────────────
@@ -214,19 +198,6 @@ def _parse_delay(normalised: str, original: str) -> ScenarioAction | None:
 # ──────────────────────────────────────────────
 
 
-def _clean_project_name(name: str, original: str) -> str:
-    """Clean and restore original case for project name.
-
-    The regex match is from the normalised (lowercase) text.
-    We find the same substring in the original text to preserve case.
-    """
-    name = name.strip().rstrip("'\"")
-
-    # Find original case version
-    name_lower = name.lower()
-    orig_lower = original.lower()
-    pos = orig_lower.find(name_lower)
-    if pos != -1:
-        name = original[pos:pos + len(name)].strip()
-
-    return name
+def _budget_action(verb: str) -> ActionType:
+    """Map a budget verb to an increase or decrease action."""
+    return ActionType.BUDGET_DECREASE if verb in ("decrease", "reduce", "lower") else ActionType.BUDGET_INCREASE
@@ -9,16 +9,18 @@ Sprint 2 — Week 5 deliverable.
 
 from __future__ import annotations
 
-import copy
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
+from functools import lru_cache, partial
 
 from src.ingestion.parser import Project
 from src.scenario.graph import DependencyGraph
 from src.scenario.parser import ActionType, ScenarioAction
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectImpact:
     """Impact of a scenario on a single project."""
 
@@ -34,13 +36,13 @@ class ProjectImpact:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenarioResult:
     """Full result of running a scenario simulation."""
 
     action: ScenarioAction
     before_state: dict[str, dict] = field(default_factory=dict)  # project → snapshot
-    after_state: dict[str, dict] = field(default_factory=dict)
+    after_state: dict[str, dict] = field(default_factory=dict)   # shares unchanged snapshots with before_state
     impacts: list[ProjectImpact] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
 
@@ -78,9 +80,21 @@ def simulate(
     if reference_date is None:
         reference_date = date.today()
 
+    project_map, lower_names = _index_projects(projects)
+    return _simulate(action, projects, project_map, lower_names, graph, reference_date)
+
+
+def _simulate(
+    action: ScenarioAction,
+    projects: list[Project],
+    project_map: dict[str, Project],
+    lower_names: dict[str, str],
+    graph: DependencyGraph,
+    reference_date: date,
+) -> ScenarioResult:
+    """simulate() against a prebuilt project index (see _index_projects)."""
     # Find the target project
-    project_map = {p.name: p for p in projects}
-    target_name = _resolve_project_name(action.project, project_map)
+    target_name = _resolve_project_name(action.project, project_map, lower_names)
 
     if target_name is None:
         result = ScenarioResult(action=action)
@@ -94,18 +108,52 @@ def simulate(
     before = {p.name: _snapshot(p) for p in projects}
 
     # Apply the scenario
-    if action.action == ActionType.REMOVE:
-        return _simulate_remove(action, target_name, projects, graph, before)
-    elif action.action in (ActionType.BUDGET_INCREASE, ActionType.BUDGET_DECREASE):
-        return _simulate_budget(action, target_name, project_map, graph, before, reference_date)
-    elif action.action == ActionType.SCOPE_CUT:
-        return _simulate_scope_cut(action, target_name, project_map, graph, before)
-    elif action.action == ActionType.DELAY:
-        return _simulate_delay(action, target_name, project_map, graph, before)
-    else:
+    simulator = _SIMULATORS.get(action.action)
+    if simulator is None:
         result = ScenarioResult(action=action, before_state=before)
         result.warnings.append(f"Unsupported action type: {action.action}")
         return result
+    return simulator(action, target_name, project_map, graph, before, reference_date)
+
+
+def simulate_batch(
+    actions: list[ScenarioAction],
+    projects: list[Project],
+    graph: DependencyGraph,
+    reference_date: date | None = None,
+    max_workers: int | None = None,
+) -> list[ScenarioResult]:
+    """Run several independent scenarios against the same portfolio.
+
+    Useful for sweeps such as "cut Beta budget by 10/20/30%".
+
+    Args:
+        actions: Parsed scenario actions.
+        projects: List of current project data.
+        graph: Dependency graph between projects.
+        reference_date: Date for calculations (defaults to today), shared by all actions.
+        max_workers: If greater than 1, run the simulations in up to this many
+            worker processes. Defaults to in-process.
+
+    Returns:
+        One ScenarioResult per action, in input order.
+    """
+    if reference_date is None:
+        reference_date = date.today()
+
+    # Index the portfolio once for the whole batch
+    project_map, lower_names = _index_projects(projects)
+    run = partial(
+        _simulate, projects=projects, project_map=project_map, lower_names=lower_names,
+        graph=graph, reference_date=reference_date,
+    )
+    if max_workers is not None and max_workers > 1 and len(actions) > 1:
+        # Each simulation is short, so hand actions out in chunks to amortise pickling
+        workers = min(len(actions), max_workers)
+        chunksize = max(1, len(actions) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, actions, chunksize=chunksize))
+    return [run(action) for action in actions]
 
 
 # ──────────────────────────────────────────────
@@ -149,9 +197,8 @@ def _simulate_budget(
     )]
 
     # Build after state
-    after = copy.deepcopy(before)
-    after[target_name]["budget"] = new_budget
-    after[target_name]["runway_weeks"] = new_runway
+    after = dict(before)
+    _update_snapshot(after, target_name, budget=new_budget, runway_weeks=new_runway)
 
     result = ScenarioResult(
         action=action,
@@ -182,6 +229,7 @@ def _simulate_scope_cut(
     project_map: dict[str, Project],
     graph: DependencyGraph,
     before: dict[str, dict],
+    reference_date: date,
 ) -> ScenarioResult:
     """Simulate a scope reduction."""
     project = project_map[target_name]
@@ -208,8 +256,7 @@ def _simulate_scope_cut(
     )]
 
     # Cascade: dependent projects may benefit from earlier delivery
-    dependents = graph.get_all_dependents(target_name)
-    for dep_name in sorted(dependents):
+    for dep_name in sorted(graph.get_all_dependents(target_name)):
         impacts.append(ProjectImpact(
             project_name=dep_name,
             impact_type="cascade",
@@ -219,10 +266,10 @@ def _simulate_scope_cut(
         ))
 
     # Build after state
-    after = copy.deepcopy(before)
-    after[target_name]["scope_pct"] = (1 - cut_pct) * 100
+    after = dict(before)
+    _update_snapshot(after, target_name, scope_pct=(1 - cut_pct) * 100)
     if new_end:
-        after[target_name]["end_date"] = new_end.isoformat()
+        _update_snapshot(after, target_name, end_date=_fmt_date(new_end))
 
     return ScenarioResult(
         action=action,
@@ -238,6 +285,7 @@ def _simulate_delay(
     project_map: dict[str, Project],
     graph: DependencyGraph,
     before: dict[str, dict],
+    reference_date: date,
 ) -> ScenarioResult:
     """Simulate a project delay."""
     project = project_map[target_name]
@@ -253,44 +301,48 @@ def _simulate_delay(
     if project.start_date:
         new_start = project.start_date + timedelta(days=delay_days)
 
+    new_start_str = _fmt_date(new_start)
+    new_end_str = _fmt_date(new_end)
+    delay_weeks_str = str(action.duration_weeks)
     impacts = [ProjectImpact(
         project_name=target_name,
         impact_type="direct",
         changes={
-            "start_date": f"{_fmt_date(old_start)} → {_fmt_date(new_start)}",
-            "end_date": f"{_fmt_date(old_end)} → {_fmt_date(new_end)}",
-            "delay_weeks": str(action.duration_weeks),
+            "start_date": f"{_fmt_date(old_start)} → {new_start_str}",
+            "end_date": f"{_fmt_date(old_end)} → {new_end_str}",
+            "delay_weeks": delay_weeks_str,
         },
     )]
 
+    # Build after state alongside the impacts, so each new date is computed once
+    after = dict(before)
+    if new_end:
+        _update_snapshot(after, target_name, end_date=new_end_str)
+    if new_start:
+        _update_snapshot(after, target_name, start_date=new_start_str)
+
     # Cascade delays on dependent projects
-    dependents = graph.get_all_dependents(target_name)
-    for dep_name in sorted(dependents):
+    # Sorted once; drives the impacts, the after state and the warning
+    dependents = sorted(graph.get_all_dependents(target_name))
+    reason = f"Cascade delay from {target_name}"
+    for dep_name in dependents:
         dep_project = project_map.get(dep_name)
         if dep_project:
             dep_old_end = dep_project.end_date
             dep_new_end = dep_old_end + timedelta(days=delay_days) if dep_old_end else None
+            dep_new_end_str = _fmt_date(dep_new_end)
+            if dep_new_end:
+                _update_snapshot(after, dep_name, end_date=dep_new_end_str)
             impacts.append(ProjectImpact(
                 project_name=dep_name,
                 impact_type="cascade",
                 changes={
-                    "end_date": f"{_fmt_date(dep_old_end)} → {_fmt_date(dep_new_end)}",
-                    "delay_weeks": str(action.duration_weeks),
-                    "reason": f"Cascade delay from {target_name}",
+                    "end_date": f"{_fmt_date(dep_old_end)} → {dep_new_end_str}",
+                    "delay_weeks": delay_weeks_str,
+                    "reason": reason,
                 },
             ))
 
-    # Build after state
-    after = copy.deepcopy(before)
-    if new_end:
-        after[target_name]["end_date"] = new_end.isoformat()
-    if new_start:
-        after[target_name]["start_date"] = new_start.isoformat()
-    for dep_name in dependents:
-        dep = project_map.get(dep_name)
-        if dep and dep.end_date:
-            after[dep_name]["end_date"] = (dep.end_date + timedelta(days=delay_days)).isoformat()
-
     result = ScenarioResult(
         action=action,
         before_state=before,
@@ -301,7 +353,7 @@ def _simulate_delay(
     if dependents:
         result.warnings.append(
             f"Delay on {target_name} cascades to {len(dependents)} dependent "
-            f"project{'s' if len(dependents) > 1 else ''}: {', '.join(sorted(dependents))}."
+            f"project{'s' if len(dependents) > 1 else ''}: {', '.join(dependents)}."
         )
 
     return result
@@ -310,12 +362,12 @@ def _simulate_delay(
 def _simulate_remove(
     action: ScenarioAction,
     target_name: str,
-    projects: list[Project],
+    project_map: dict[str, Project],
     graph: DependencyGraph,
     before: dict[str, dict],
+    reference_date: date,
 ) -> ScenarioResult:
     """Simulate removing a project from the portfolio."""
-    project_map = {p.name: p for p in projects}
     project = project_map[target_name]
 
     impacts = [ProjectImpact(
@@ -329,8 +381,8 @@ def _simulate_remove(
     )]
 
     # Flag dependent projects that lose a dependency
-    dependents = graph.get_dependents(target_name)
-    for dep_name in sorted(dependents):
+    dependents = sorted(graph.get_dependents(target_name))
+    for dep_name in dependents:
         impacts.append(ProjectImpact(
             project_name=dep_name,
             impact_type="cascade",
@@ -340,8 +392,8 @@ def _simulate_remove(
         ))
 
     # Build after state (remove target)
-    after = copy.deepcopy(before)
-    after[target_name]["status"] = "Removed"
+    after = dict(before)
+    _update_snapshot(after, target_name, status="Removed")
 
     result = ScenarioResult(
         action=action,
@@ -352,13 +404,26 @@ def _simulate_remove(
 
     if dependents:
         result.warnings.append(
-            f"Removing {target_name} breaks dependencies for: {', '.join(sorted(dependents))}. "
+            f"Removing {target_name} breaks dependencies for: {', '.join(dependents)}. "
             f"These projects may need re-scoping or alternative delivery paths."
         )
 
     return result
 
 
+# Simulator per action type; all share one signature
+_SIMULATORS: dict[
+    ActionType,
+    Callable[[ScenarioAction, str, dict[str, Project], DependencyGraph, dict[str, dict], date], ScenarioResult],
+] = {
+    ActionType.BUDGET_INCREASE: _simulate_budget,
+    ActionType.BUDGET_DECREASE: _simulate_budget,
+    ActionType.SCOPE_CUT: _simulate_scope_cut,
+    ActionType.DELAY: _simulate_delay,
+    ActionType.REMOVE: _simulate_remove,
+}
+
+
 # ──────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────
@@ -369,8 +434,8 @@ def _snapshot(project: Project) -> dict:
     return {
         "name": project.name,
         "status": project.status,
-        "start_date": project.start_date.isoformat() if project.start_date else None,
-        "end_date": project.end_date.isoformat() if project.end_date else None,
+        "start_date": _fmt_date(project.start_date) if project.start_date else None,
+        "end_date": _fmt_date(project.end_date) if project.end_date else None,
         "budget": project.budget,
         "actual_spend": project.actual_spend,
         "scope_pct": 100.0,
@@ -378,22 +443,18 @@ def _snapshot(project: Project) -> dict:
     }
 
 
-def _calc_runway_weeks(project: Project, ref_date: date) -> int | None:
-    """Calculate remaining runway in weeks based on current burn rate."""
-    if project.budget <= 0 or project.actual_spend <= 0:
-        return None
-    if project.start_date is None:
-        return None
+def _update_snapshot(state: dict[str, dict], name: str, **changes) -> None:
+    """Replace one project's snapshot in state with an updated copy.
 
-    elapsed_days = max(1, (ref_date - project.start_date).days)
-    daily_burn = project.actual_spend / elapsed_days
-    remaining_budget = project.budget - project.actual_spend
+    The after state starts as a shallow copy of the before state, so untouched
+    projects share their snapshot dicts; only changed projects get new ones.
+    """
+    state[name] = {**state[name], **changes}
 
-    if daily_burn <= 0 or remaining_budget <= 0:
-        return 0
 
-    remaining_days = remaining_budget / daily_burn
-    return int(remaining_days / 7)
+def _calc_runway_weeks(project: Project, ref_date: date) -> int | None:
+    """Calculate remaining runway in weeks based on current burn rate."""
+    return _calc_runway_weeks_with_budget(project, project.budget, ref_date)
 
 
 def _calc_runway_weeks_with_budget(project: Project, new_budget: float, ref_date: date) -> int | None:
@@ -414,18 +475,24 @@ def _calc_runway_weeks_with_budget(project: Project, new_budget: float, ref_date
     return int(remaining_days / 7)
 
 
-def _resolve_project_name(name: str, project_map: dict[str, Project]) -> str | None:
+def _index_projects(projects: list[Project]) -> tuple[dict[str, Project], dict[str, str]]:
+    """Build the name → project map and the lowercase name → project name index."""
+    project_map = {p.name: p for p in projects}
+    lower_names: dict[str, str] = {}
+    for pname in project_map:
+        # First project wins when names differ only by case
+        lower_names.setdefault(pname.lower(), pname)
+    return project_map, lower_names
+
+
+def _resolve_project_name(name: str, project_map: dict[str, Project], lower_names: dict[str, str]) -> str | None:
     """Resolve a project name (case-insensitive)."""
     if name in project_map:
         return name
-
-    name_lower = name.lower()
-    for pname in project_map:
-        if pname.lower() == name_lower:
-            return pname
-
-    return None
+    return lower_names.get(name.lower())
 
 
+@lru_cache(maxsize=1024)
 def _fmt_date(d: date | None) -> str:
+    """ISO date string, or "N/A". Cached: portfolios reuse the same milestone dates."""
     return d.isoformat() if d else "N/A"
@@ -7,44 +7,55 @@ Run once to create test fixture files:
 import csv
 import json
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; fall back to the stdlib json module
+    orjson = None
 
 SAMPLE_DIR = Path(__file__).parent.parent.parent / "sample-data"
 FIXTURE_DIR = Path(__file__).parent
 CSV_FILE = SAMPLE_DIR / "jira-export-sample.csv"
 
 
-def generate_json_flat():
-    """Generate a flat JSON file (list of row objects)."""
+def read_csv_rows() -> list[dict[str, str]]:
+    """Read the sample CSV once; the JSON generators all share its rows."""
     with open(CSV_FILE, newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
+        return list(csv.DictReader(f))
 
-    output = FIXTURE_DIR / "jira-export-flat.json"
+
+def _write_json(output: Path, data: Any) -> None:
+    """Write data as 2-space indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        output.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with open(output, "w", encoding="utf-8") as f:
-        json.dump(rows, f, indent=2)
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def generate_json_flat(rows: list[dict[str, str]]):
+    """Generate a flat JSON file (list of row objects)."""
+    output = FIXTURE_DIR / "jira-export-flat.json"
+    _write_json(output, rows)
     print(f"Created: {output}")
 
 
-def generate_json_wrapped():
+def generate_json_wrapped(rows: list[dict[str, str]]):
     """Generate a wrapped JSON file (dict with 'issues' key)."""
-    with open(CSV_FILE, newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
-
     output = FIXTURE_DIR / "jira-export-wrapped.json"
-    with open(output, "w", encoding="utf-8") as f:
-        json.dump({"issues": rows, "total": len(rows)}, f, indent=2)
+    _write_json(output, {"issues": rows, "total": len(rows)})
     print(f"Created: {output}")
 
 
-def generate_json_nested():
+def generate_json_nested(rows: list[dict[str, str]]):
     """Generate a nested JSON file (projects with embedded tasks)."""
-    with open(CSV_FILE, newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
-
     projects: dict[str, dict] = {}
     for row in rows:
         pname = row["Project"]
-        if pname not in projects:
-            projects[pname] = {
+        project = projects.get(pname)
+        if project is None:
+            project = projects[pname] = {
                 "name": pname,
                 "project_status": row["Project Status"],
                 "start_date": row["Start Date"],
@@ -53,7 +64,7 @@ def generate_json_nested():
                 "actual_spend": row["Actual Spend"],
                 "tasks": [],
             }
-        projects[pname]["tasks"].append({
+        project["tasks"].append({
             "task_name": row["Task Name"],
             "task_status": row["Task Status"],
             "priority": row["Priority"],
@@ -64,8 +75,7 @@ def generate_json_nested():
         })
 
     output = FIXTURE_DIR / "jira-export-nested.json"
-    with open(output, "w", encoding="utf-8") as f:
-        json.dump({"projects": list(projects.values())}, f, indent=2)
+    _write_json(output, {"projects": list(projects.values())})
     print(f"Created: {output}")
 
 
@@ -77,16 +87,13 @@ def generate_xlsx():
         print("Skipping XLSX generation — openpyxl not installed")
         return
 
-    with open(CSV_FILE, newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        rows = list(reader)
-
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "Project Export"
+    # Write-only mode streams each row to the file instead of building cells in memory
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("Project Export")
 
-    for row in rows:
-        ws.append(row)
+    with open(CSV_FILE, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            ws.append(row)
 
     output = FIXTURE_DIR / "jira-export-sample.xlsx"
     wb.save(output)
@@ -96,8 +103,9 @@ def generate_xlsx():
 
 if __name__ == "__main__":
     FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
-    generate_json_flat()
-    generate_json_wrapped()
-    generate_json_nested()
+    rows = read_csv_rows()
+    generate_json_flat(rows)
+    generate_json_wrapped(rows)
+    generate_json_nested(rows)
     generate_xlsx()
     print("Done!")
@@ -32,6 +32,18 @@ SAMPLE_XLSX = FIXTURE_DIR / "jira-export-sample.xlsx"
 REF_DATE = date(2026, 2, 19)
 
 
+@pytest.fixture(scope="module")
+def parsed_sample_projects():
+    """Sample CSV parsed once for the module; tests only read it."""
+    return parse_file(SAMPLE_CSV)
+
+
+@pytest.fixture(scope="module")
+def sample_report(parsed_sample_projects) -> PortfolioRiskReport:
+    """Top-5 risk report for the sample CSV, shared read-only across tests."""
+    return analyse_portfolio(parsed_sample_projects, top_n=5, reference_date=REF_DATE)
+
+
 # ──────────────────────────────────────────────
 # Full pipeline: validate → parse → analyse
 # ──────────────────────────────────────────────
@@ -50,26 +62,23 @@ class TestEndToEndCSV:
         elapsed = time.time() - start
         assert elapsed < 30.0, f"Pipeline took {elapsed:.2f}s (limit: 30s)"
 
-    def test_produces_valid_report(self):
-        projects = parse_file(SAMPLE_CSV)
-        report = analyse_portfolio(projects, top_n=5, reference_date=REF_DATE)
+    def test_produces_valid_report(self, sample_report):
+        report = sample_report
         assert isinstance(report, PortfolioRiskReport)
         assert len(report.project_summaries) == 6
         assert report.total_risks > 0
 
-    def test_json_serialisable(self):
+    def test_json_serialisable(self, sample_report):
         """Output must be JSON-serialisable for downstream consumers."""
-        projects = parse_file(SAMPLE_CSV)
-        report = analyse_portfolio(projects, top_n=5, reference_date=REF_DATE)
+        report = sample_report
         json_str = json.dumps(report.to_dict(), indent=2)
         parsed = json.loads(json_str)
         assert "project_summaries" in parsed
         assert parsed["portfolio_rag"] in ("Red", "Amber", "Green")
 
-    def test_all_risk_categories_present(self):
+    def test_all_risk_categories_present(self, parsed_sample_projects):
         """All four risk detectors should find at least one risk."""
-        projects = parse_file(SAMPLE_CSV)
-        report = analyse_portfolio(projects, top_n=10, reference_date=REF_DATE)
+        report = analyse_portfolio(parsed_sample_projects, top_n=10, reference_date=REF_DATE)
         all_categories = set()
         for summary in report.project_summaries:
             for risk in summary.risks:
@@ -79,10 +88,9 @@ class TestEndToEndCSV:
         assert RiskCategory.BURN_RATE in all_categories
         assert RiskCategory.DEPENDENCY in all_categories
 
-    def test_explanations_are_plain_english(self):
+    def test_explanations_are_plain_english(self, sample_report):
         """PID acceptance: risk explanations are plain-English."""
-        projects = parse_file(SAMPLE_CSV)
-        report = analyse_portfolio(projects, top_n=5, reference_date=REF_DATE)
+        report = sample_report
         for summary in report.project_summaries:
             for risk in summary.risks:
                 # Should contain project name
@@ -92,17 +100,15 @@ class TestEndToEndCSV:
                 # Should not contain raw code/JSON
                 assert "{" not in risk.explanation, f"Contains code: {risk.explanation}"
 
-    def test_top_5_per_project(self):
+    def test_top_5_per_project(self, sample_report):
         """Each project should have at most 5 risks (top_n=5)."""
-        projects = parse_file(SAMPLE_CSV)
-        report = analyse_portfolio(projects, top_n=5, reference_date=REF_DATE)
+        report = sample_report
         for summary in report.project_summaries:
             assert summary.risk_count <= 5
 
-    def test_expected_project_rag_statuses(self):
+    def test_expected_project_rag_statuses(self, sample_report):
         """Validate known risk patterns in sample data."""
-        projects = parse_file(SAMPLE_CSV)
-        report = analyse_portfolio(projects, top_n=5, reference_date=REF_DATE)
+        report = sample_report
         rag = {s.project_name: s.rag_status for s in report.project_summaries}
 
         # High-risk projects (baked into sample data)
@@ -117,11 +123,10 @@ class TestEndToEndCSV:
 class TestEndToEndJSON:
     """Full pipeline with JSON input."""
 
-    def test_produces_same_results_as_csv(self):
-        csv_projects = parse_file(SAMPLE_CSV)
+    def test_produces_same_results_as_csv(self, sample_report):
         json_projects = parse_file(FLAT_JSON)
 
-        csv_report = analyse_portfolio(csv_projects, top_n=5, reference_date=REF_DATE)
+        csv_report = sample_report
         json_report = analyse_portfolio(json_projects, top_n=5, reference_date=REF_DATE)
 
         assert csv_report.total_risks == json_report.total_risks
@@ -132,11 +137,10 @@ class TestEndToEndJSON:
 class TestEndToEndXLSX:
     """Full pipeline with Excel input."""
 
-    def test_produces_same_results_as_csv(self):
-        csv_projects = parse_file(SAMPLE_CSV)
+    def test_produces_same_results_as_csv(self, sample_report):
         xlsx_projects = parse_file(SAMPLE_XLSX)
 
-        csv_report = analyse_portfolio(csv_projects, top_n=5, reference_date=REF_DATE)
+        csv_report = sample_report
         xlsx_report = analyse_portfolio(xlsx_projects, top_n=5, reference_date=REF_DATE)
 
         assert csv_report.total_risks == xlsx_report.total_risks
@@ -181,9 +185,8 @@ class TestOutputQuality:
     """Ensure the output is suitable for downstream artefact generation."""
 
     @pytest.fixture()
-    def report(self) -> PortfolioRiskReport:
-        projects = parse_file(SAMPLE_CSV)
-        return analyse_portfolio(projects, top_n=5, reference_date=REF_DATE)
+    def report(self, sample_report) -> PortfolioRiskReport:
+        return sample_report
 
     def test_every_risk_has_mitigation(self, report):
         for summary in report.project_summaries:
@@ -101,6 +101,12 @@ class TestNarrativeGenerator:
         assert "full_text" in d
         assert "recommendations" in d
 
+    def test_full_text_reflects_edits(self, scope_cut_result):
+        narrative = generate_narrative(scope_cut_result)
+        assert "Late change" not in narrative.full_text
+        narrative.warnings = ["Late change"]
+        assert "- Late change" in narrative.full_text
+
     def test_narrative_cxo_language(self, scope_cut_result):
         """Narrative should be CXO-level — no code, no jargon."""
         narrative = generate_narrative(scope_cut_result)
@@ -88,26 +88,36 @@ class TestBlockerKeywords:
         found, _ = _has_blocker_keyword(task)
         assert found is True
 
+    def test_context_uses_earliest_mention(self):
+        task = Task(name="T1", status="In Progress", comments="Stalled since Monday. " + "x" * 80 + " Blocked by legal")
+        found, context = _has_blocker_keyword(task)
+        assert found is True
+        assert context.startswith("Stalled since Monday")
+        assert "legal" not in context
+
 
 class TestSeverityMapping:
 
     def test_critical_priority(self):
-        assert _severity_from_priority("Critical") == RiskSeverity.CRITICAL
+        assert _severity_from_priority(Task(name="T1", status="To Do", priority="Critical")) == RiskSeverity.CRITICAL
 
     def test_high_priority(self):
-        assert _severity_from_priority("High") == RiskSeverity.HIGH
+        assert _severity_from_priority(Task(name="T1", status="To Do", priority="High")) == RiskSeverity.HIGH
 
     def test_medium_priority(self):
-        assert _severity_from_priority("Medium") == RiskSeverity.MEDIUM
+        assert _severity_from_priority(Task(name="T1", status="To Do", priority="Medium")) == RiskSeverity.MEDIUM
 
     def test_low_priority(self):
-        assert _severity_from_priority("Low") == RiskSeverity.LOW
+        assert _severity_from_priority(Task(name="T1", status="To Do", priority="Low")) == RiskSeverity.LOW
 
     def test_unknown_defaults_to_medium(self):
-        assert _severity_from_priority("Unknown") == RiskSeverity.MEDIUM
+        assert _severity_from_priority(Task(name="T1", status="To Do", priority="Unknown")) == RiskSeverity.MEDIUM
 
     def test_case_insensitive(self):
-        assert _severity_from_priority("HIGH") == RiskSeverity.HIGH
+        assert _severity_from_priority(Task(name="T1", status="To Do", priority="HIGH")) == RiskSeverity.HIGH
+
+    def test_whitespace_stripped(self):
+        assert _severity_from_priority(Task(name="T1", status="To Do", priority=" Low ")) == RiskSeverity.LOW
 
 
 class TestSeverityElevation:
@@ -3,10 +3,14 @@
 from datetime import date
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from src.ingestion.parser import Project, parse_file
-from src.risk_engine.burnrate import detect_burn_rate, _burn_rate_severity, _fmt_pct, _fmt_currency
+from src.risk_engine.burnrate import (
+    detect_burn_rate, detect_burn_rate_batch, _burn_rate_severity, _classify, _fmt_pct, _fmt_currency,
+    _SEVERITY_BY_CODE,
+)
 from src.risk_engine.engine import RiskCategory, RiskSeverity
 
 SAMPLE_CSV = Path(__file__).parent.parent.parent / "sample-data" / "jira-export-sample.csv"
@@ -46,6 +50,24 @@ class TestBurnRateSeverity:
     def test_90pct_with_12pct_remaining_is_high(self):
         assert _burn_rate_severity(0.91, 0.12) == RiskSeverity.HIGH
 
+    def test_classify_matches_scalar(self):
+        spend = np.array([0.96, 0.92, 0.91, 0.90, 0.85, 0.95])
+        remaining = np.array([0.15, 0.25, 0.12, 0.20, 0.50, 0.00])
+        codes = _classify(spend, remaining)
+        expected = [_burn_rate_severity(s, r) for s, r in zip(spend.tolist(), remaining.tolist())]
+        assert [_SEVERITY_BY_CODE[c] for c in codes] == expected
+
+    def test_classify_matches_scalar_at_boundaries(self):
+        spend = np.array([0.95, 0.95, 0.90, 0.90, 0.90, 0.8999, 0.9499])
+        remaining = np.array([0.0, 0.20, 0.20, 0.1999, 0.0, 0.20, 0.1999])
+        codes = _classify(spend, remaining)
+        expected = [_burn_rate_severity(s, r) for s, r in zip(spend.tolist(), remaining.tolist())]
+        assert [_SEVERITY_BY_CODE[c] for c in codes] == expected
+        assert expected == [
+            RiskSeverity.CRITICAL, RiskSeverity.CRITICAL, RiskSeverity.CRITICAL,
+            RiskSeverity.HIGH, RiskSeverity.HIGH, RiskSeverity.MEDIUM, RiskSeverity.HIGH,
+        ]
+
 
 # ──────────────────────────────────────────────
 # Detection tests with synthetic data
@@ -223,3 +245,47 @@ class TestDetectBurnRateSampleData:
         delta = next(p for p in projects if p.name == "Delta")
         risks = detect_burn_rate(delta, reference_date=REF_DATE)
         assert len(risks) == 0
+
+    def test_batch_severities_and_titles(self, projects):
+        """Batch detection returns one risk list per project, in input order.
+
+        Epsilon: 58k/60k spent, 40 of 150 days left (27%) → Critical.
+        Gamma: 185k/200k spent, 70 of 241 days left (29%) → Critical.
+        """
+        batch = detect_burn_rate_batch(projects, reference_date=REF_DATE)
+        assert len(batch) == len(projects)
+        flagged = {
+            project.name: [(r.severity, r.title) for r in risks]
+            for project, risks in zip(projects, batch) if risks
+        }
+        assert flagged == {
+            "Epsilon": [(RiskSeverity.CRITICAL, "Epsilon: 97% of budget gone, 27% of timeline left")],
+            "Gamma": [(RiskSeverity.CRITICAL, "Gamma: 92% of budget gone, 29% of timeline left")],
+        }
+
+    def test_batch_mixed_severities(self):
+        """Batch classification agrees with the scalar severity for each row."""
+        high = Project(
+            name="High", status="In Progress",
+            start_date=date(2026, 1, 1), end_date=date(2026, 3, 1),
+            budget=100000, actual_spend=91000,
+        )
+        healthy = Project(
+            name="Healthy", status="In Progress",
+            start_date=date(2026, 1, 1), end_date=date(2026, 12, 31),
+            budget=100000, actual_spend=89000,
+        )
+        over = Project(
+            name="Over", status="In Progress",
+            start_date=date(2026, 1, 1), end_date=date(2026, 6, 30),
+            budget=100000, actual_spend=110000,
+        )
+        batch = detect_burn_rate_batch([high, healthy, over], reference_date=REF_DATE)
+        assert [[r.severity for r in risks] for risks in batch] == [
+            [RiskSeverity.HIGH], [], [RiskSeverity.CRITICAL],
+        ]
+        assert batch[0][0].severity == _burn_rate_severity(0.91, 10 / 59)
+        assert "over budget" in batch[2][0].title.lower()
+
+    def test_batch_empty_portfolio(self):
+        assert detect_burn_rate_batch([], reference_date=REF_DATE) == []
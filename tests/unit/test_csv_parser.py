@@ -16,6 +16,7 @@ from src.ingestion.parser import (
     _parse_float,
     _parse_sprint_history,
     parse_file,
+    parse_files,
 )
 
 # Path to sample data
@@ -69,6 +70,42 @@ class TestParseFileDispatcher:
         assert len(projects) == 1
 
 
+class TestParseFiles:
+    """Tests for the multi-file parse_files() entry point."""
+
+    def _write_csv(self, path: Path, project: str) -> Path:
+        """Helper to write a one-task CSV file."""
+        path.write_text(f"Project,Task Name,Task Status\n{project},Build API,Done\n")
+        return path
+
+    def test_empty_input(self):
+        """No paths returns an empty list."""
+        assert parse_files([]) == []
+
+    def test_single_file_matches_parse_file(self):
+        """A single path gives the same result as parse_file()."""
+        assert parse_files([SAMPLE_CSV]) == parse_file(SAMPLE_CSV)
+
+    def test_multiple_files_combined_and_sorted(self, tmp_path):
+        """Projects from all files are combined and sorted by name."""
+        files = [
+            self._write_csv(tmp_path / "team-b.csv", "Zulu"),
+            self._write_csv(tmp_path / "team-a.csv", "Bravo"),
+            SAMPLE_CSV,
+        ]
+        projects = parse_files(files, max_workers=2)
+        names = [p.name for p in projects]
+        assert len(projects) == 8
+        assert names == sorted(names)
+        assert "Bravo" in names and "Zulu" in names
+
+    def test_missing_file_raises(self, tmp_path):
+        """Errors from a worker propagate to the caller."""
+        files = [self._write_csv(tmp_path / "ok.csv", "Alpha"), tmp_path / "missing.csv"]
+        with pytest.raises(FileNotFoundError):
+            parse_files(files, max_workers=2)
+
+
 # ──────────────────────────────────────────────
 # CSV parser tests — sample data
 # ──────────────────────────────────────────────
@@ -276,6 +313,17 @@ class TestCSVParserEdgeCases:
         assert len(projects) == 1
         assert projects[0].name == "Alpha"
 
+    def test_quoted_crlf_in_comments(self, tmp_path):
+        """Quoted CRLF line breaks inside a field are kept verbatim."""
+        filepath = tmp_path / "bom.csv"
+        with open(filepath, "w", encoding="utf-8-sig", newline="") as f:
+            f.write("Project,Task Name,Task Status,Comments\r\n")
+            f.write('Alpha,Build API,Done,"line one\r\nline two"\r\n')
+            f.write("Beta,Design,To Do,\r\n")
+        projects = parse_file(filepath)
+        assert [p.name for p in projects] == ["Alpha", "Beta"]
+        assert projects[0].tasks[0].comments == "line one\r\nline two"
+
     def test_currency_in_budget(self, tmp_path):
         """Parser handles currency symbols and commas in budget fields."""
         filepath = self._write_csv(
@@ -331,6 +379,16 @@ class TestDateParser:
     def test_whitespace_stripped(self):
         assert _parse_date("  2026-01-15  ") == date(2026, 1, 15)
 
+    def test_sentinel_values(self):
+        for value in ("0", "-", "N/A", "None", "null", "TBD", "Unknown"):
+            assert _parse_date(value) is None
+
+    def test_padded_long_month_format(self):
+        assert _parse_date("September  30,  2026") == date(2026, 9, 30)
+
+    def test_overlong_value(self):
+        assert _parse_date("2026-01-15 and some trailing notes") is None
+
 
 # ──────────────────────────────────────────────
 # Float parser tests
@@ -36,6 +36,11 @@ class TestDependencyGraph:
         g = DependencyGraph()
         assert g.get_dependents("Alpha") == set()
 
+    def test_dependents_from_constructor_edges(self):
+        g = DependencyGraph(edges={"Beta": {"Alpha"}, "Gamma": {"Beta"}})
+        assert g.get_dependents("Alpha") == {"Beta"}
+        assert g.get_all_dependents("Alpha") == {"Beta", "Gamma"}
+
     def test_transitive_dependents(self):
         """A → B → C: if A slips, both B and C are affected."""
         g = DependencyGraph(all_projects={"A", "B", "C"})
@@ -43,6 +48,15 @@ class TestDependencyGraph:
         g.add_dependency("C", "B")
         assert g.get_all_dependents("A") == {"B", "C"}
 
+    def test_transitive_dependents_refresh_after_new_edge(self):
+        g = DependencyGraph(all_projects={"A", "B", "C"})
+        g.add_dependency("B", "A")
+        first = g.get_all_dependents("A")
+        first.add("Mutated")
+        assert g.get_all_dependents("A") == {"B"}
+        g.add_dependency("C", "B")
+        assert g.get_all_dependents("A") == {"B", "C"}
+
     def test_transitive_dependencies(self):
         """C depends on B depends on A: C's full dependency chain is {A, B}."""
         g = DependencyGraph(all_projects={"A", "B", "C"})
@@ -75,6 +89,15 @@ class TestDependencyGraph:
         g.add_dependency("C", "B")
         assert g.has_circular_dependency() is None
 
+    def test_deep_chain_does_not_recurse(self):
+        names = [f"P{i}" for i in range(5000)]
+        g = DependencyGraph(all_projects=set(names))
+        for a, b in zip(names, names[1:]):
+            g.add_dependency(a, b)
+        assert g.has_circular_dependency() is None
+        g.add_dependency(names[-1], names[0])
+        assert len(g.has_circular_dependency()) == len(names) + 1
+
     def test_to_dict(self):
         g = DependencyGraph(all_projects={"Alpha", "Beta"})
         g.add_dependency("Beta", "Alpha")
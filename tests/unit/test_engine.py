@@ -270,3 +270,8 @@ class TestAnalysePortfolioSampleData:
                 assert risk.severity
                 assert risk.title
                 assert risk.explanation
+
+    def test_worker_processes_match_in_process(self, report):
+        projects = parse_file(SAMPLE_CSV)
+        parallel = analyse_portfolio(projects, top_n=5, reference_date=REF_DATE, max_workers=2)
+        assert parallel.to_dict() == report.to_dict()
@@ -0,0 +1,112 @@
+"""Unit tests for the executive action summary generator (Sprint 7)."""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from src.ingestion.parser import parse_file
+from src.insights import generate_executive_summary
+from src.risk_engine.engine import (
+    PortfolioRiskReport,
+    ProjectRiskSummary,
+    Risk,
+    RiskCategory,
+    RiskSeverity,
+    analyse_portfolio,
+)
+
+SAMPLE = Path(__file__).parent.parent.parent / "sample-data" / "jira-export-sample.csv"
+REF_DATE = date(2026, 2, 19)
+
+
+def _summary(name: str, risks: list[Risk], status: str = "In Progress") -> ProjectRiskSummary:
+    return ProjectRiskSummary(
+        project_name=name,
+        project_status=status,
+        risk_count=len(risks),
+        top_severity=risks[0].severity if risks else RiskSeverity.LOW,
+        risks=risks,
+    )
+
+
+def _risk(project: str, category: RiskCategory, severity: RiskSeverity, explanation: str = "") -> Risk:
+    return Risk(project, category, severity, title="t", explanation=explanation)
+
+
+@pytest.fixture()
+def risk_report():
+    return analyse_portfolio(parse_file(SAMPLE), top_n=5, reference_date=REF_DATE)
+
+
+class TestExecutiveSummary:
+
+    def test_sample_flags_budget_critical_projects(self, risk_report):
+        text = generate_executive_summary(risk_report)
+        assert text.startswith("Your portfolio has 2 urgent issues")
+        assert "(1) Epsilon will exhaust its budget" in text
+        assert "(2) Gamma will exhaust its budget" in text
+        assert "emergency portfolio review" in text
+
+    def test_healthy_portfolio(self):
+        report = PortfolioRiskReport(project_summaries=[
+            _summary("Alpha", []),
+            _summary("Beta", [_risk("Beta", RiskCategory.DEPENDENCY, RiskSeverity.MEDIUM)]),
+        ])
+        text = generate_executive_summary(report)
+        assert "tracking 2 active projects with 0 at Red status and 1 at Amber" in text
+        assert "No critical escalation needed" in text
+
+    def test_compliance_project_escalated(self):
+        report = PortfolioRiskReport(project_summaries=[
+            _summary("Cyber Uplift", [
+                _risk("Cyber Uplift", RiskCategory.BLOCKED_WORK, RiskSeverity.CRITICAL),
+                _risk("Cyber Uplift", RiskCategory.CHRONIC_CARRYOVER, RiskSeverity.CRITICAL),
+            ]),
+        ])
+        text = generate_executive_summary(report)
+        assert "Cyber Uplift has 2 critical issues and may miss its regulatory deadline" in text
+
+    def test_blocked_cascade(self):
+        report = PortfolioRiskReport(project_summaries=[
+            _summary("Alpha - Core", [_risk("Alpha - Core", RiskCategory.BLOCKED_WORK, RiskSeverity.HIGH)]),
+            _summary("Beta", [
+                _risk("Beta", RiskCategory.DEPENDENCY, RiskSeverity.MEDIUM, "Waiting for Alpha to ship the API"),
+            ]),
+        ])
+        text = generate_executive_summary(report)
+        assert "blockers in Alpha - Core are cascading into dependent projects" in text
+        assert "address these items before the next steering cycle" in text
+
+    def test_on_hold_projects(self):
+        report = PortfolioRiskReport(project_summaries=[
+            _summary("Delta", [_risk("Delta", RiskCategory.DEPENDENCY, RiskSeverity.LOW)], status="On Hold"),
+        ])
+        text = generate_executive_summary(report)
+        assert "(1) Delta stalled — confirm go/no-go" in text
+        assert "review at next scheduled steering committee" in text
+
+    def test_at_most_three_items(self):
+        summaries = [
+            _summary(name, [_risk(name, RiskCategory.BURN_RATE, RiskSeverity.CRITICAL)])
+            for name in ("A", "B", "C", "D", "E")
+        ]
+        text = generate_executive_summary(PortfolioRiskReport(project_summaries=summaries))
+        assert text.startswith("Your portfolio has 3 urgent issues")
+        assert "(3) C will exhaust" in text
+        assert "(4)" not in text
+
+    def test_cascade_reported_once_per_blocker(self):
+        report = PortfolioRiskReport(project_summaries=[
+            _summary("Alpha", [_risk("Alpha", RiskCategory.BLOCKED_WORK, RiskSeverity.HIGH)]),
+            _summary("Beta", [
+                _risk("Beta", RiskCategory.DEPENDENCY, RiskSeverity.MEDIUM, "Needs Alpha sign-off"),
+                _risk("Beta", RiskCategory.DEPENDENCY, RiskSeverity.MEDIUM, "Alpha API late"),
+            ]),
+            _summary("Gamma", [
+                _risk("Gamma", RiskCategory.DEPENDENCY, RiskSeverity.MEDIUM, "Blocked on alpha"),
+            ]),
+        ])
+        text = generate_executive_summary(report)
+        assert text.count("blockers in Alpha") == 1
+        assert text.startswith("Your portfolio has 1 urgent issue this cycle")
@@ -3,6 +3,7 @@
 from datetime import date
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from src.ingestion.parser import parse_file
@@ -10,7 +11,7 @@ from src.risk_engine.engine import analyse_portfolio
 from src.benefits.parser import parse_benefits
 from src.benefits.calculator import analyse_benefits
 from src.investment import (
-    analyse_investments, InvestmentAction, PortfolioInvestmentReport,
+    analyse_investments, group_by_action, InvestmentAction, PortfolioInvestmentReport,
 )
 
 SAMPLE_PROJECTS = Path(__file__).parent.parent.parent / "sample-data" / "jira-export-sample.csv"
@@ -77,6 +78,18 @@ class TestInvestmentAnalysis:
         assert "portfolio_roi" in d
         assert "project_investments" in d
 
+    def test_display_strings(self, report):
+        pi = report.project_investments[0]
+        assert pi.rank_str == "1"
+        assert pi.budget_str == f"£{pi.budget:,.0f}"
+        assert pi.roi_str == f"{pi.roi:.0%}"
+
+    def test_group_by_action(self, report):
+        groups = group_by_action(report.project_investments)
+        assert sum(len(g) for g in groups.values()) == len(report.project_investments)
+        for action, items in groups.items():
+            assert all(pi.action == action for pi in items)
+
     def test_value_at_risk(self, report):
         # Should identify some value-at-risk projects given Red RAGs
         # (may be empty if no projects qualify for divest/review with budget)
@@ -93,17 +106,52 @@ class TestWithoutBenefits:
 
 class TestInvestmentActions:
 
-    def test_red_negative_roi_divest(self):
-        from src.investment import _determine_action
-        action, _ = _determine_action("Red", -0.3, 0.5, 5, 0.9)
+    def test_classify_actions(self):
+        from src.investment import _action_from_code, _classify_actions
+        codes = _classify_actions(
+            np.array(["Red", "Green", "Red"]),
+            np.array([-0.3, 0.8, 0.5]),
+            np.array([0.5, 0.1, 0.4]),
+            np.array([0.9, 0.3, 0.5]),
+        )
+        actions = [_action_from_code(int(c), "", 0.0, 0.0, 0.0)[0] for c in codes]
+        assert actions == [InvestmentAction.DIVEST, InvestmentAction.INVEST, InvestmentAction.REVIEW]
+
+    def test_classify_actions_default_hold(self):
+        from src.investment import _action_from_code, _classify_actions
+        codes = _classify_actions(
+            np.array(["Amber"]), np.array([0.2]), np.array([0.1]), np.array([0.5]),
+        )
+        action, rationale = _action_from_code(int(codes[0]), "Amber", 0.2, 0.1, 0.5)
+        assert action == InvestmentAction.HOLD
+        assert "ROI: 20%, RAG: Amber" in rationale
+
+    def test_action_from_code_formats_rationale(self):
+        from src.investment import _action_from_code
+        action, rationale = _action_from_code(2, "Red", -0.3, 0.5, 0.9)
         assert action == InvestmentAction.DIVEST
+        assert rationale.startswith("Negative ROI (-30%) and Red delivery status.")
+
+
+class TestRoiTable:
+
+    def test_action_and_rag_cells_keep_their_colours(self, report):
+        from docx import Document
+        from docx.oxml.ns import qn
+
+        from src.artefacts.docx_generator import RAG_BG, BrandConfig
+        from src.investment.artefacts import ACTION_COLOURS, _add_roi_table
+
+        doc = Document()
+        _add_roi_table(doc, report, BrandConfig())
+        rows = doc.tables[0].rows[1:]
+        assert len(rows) == len(report.project_investments)
 
-    def test_green_positive_roi_invest(self):
-        from src.investment import _determine_action
-        action, _ = _determine_action("Green", 0.8, 0.1, 1, 0.3)
-        assert action == InvestmentAction.INVEST
+        def fills(cell):
+            return [shd.get(qn("w:fill")) for shd in cell._element.tcPr.iter(qn("w:shd"))]
 
-    def test_red_positive_roi_review(self):
-        from src.investment import _determine_action
-        action, _ = _determine_action("Red", 0.5, 0.4, 5, 0.5)
-        assert action == InvestmentAction.REVIEW
+        for idx, (row, pi) in enumerate(zip(rows, report.project_investments)):
+            cells = row.cells
+            assert fills(cells[0]) == ["F8F9FA" if idx % 2 == 0 else "FFFFFF"]
+            assert fills(cells[4]) == [ACTION_COLOURS[pi.action][1]]
+            assert fills(cells[5]) == [RAG_BG.get(pi.rag_status, "F0F0F0")]
@@ -176,6 +176,22 @@ class TestJSONEdgeCases:
         assert projects[0].budget == 100_000.0
         assert projects[0].actual_spend == 45_000.5
 
+    def test_utf8_bom_handling(self, tmp_path):
+        """JSON files saved with a UTF-8 BOM parse correctly."""
+        f = tmp_path / "bom.json"
+        f.write_text('[{"Project": "Alpha", "Task Name": "Build API", "Task Status": "Done"}]', encoding="utf-8-sig")
+        projects = parse_file(f)
+        assert len(projects) == 1
+        assert projects[0].name == "Alpha"
+
+    def test_nan_values_accepted(self, tmp_path):
+        """Non-standard NaN (as written by pandas) still parses, as with the stdlib json module."""
+        f = tmp_path / "nan.json"
+        f.write_text('[{"Project": "Alpha", "Task Name": "Build API", "Task Status": "Done", "Previous Sprints": NaN}]')
+        projects = parse_file(f)
+        assert len(projects) == 1
+        assert projects[0].tasks[0].name == "Build API"
+
     def test_list_values_joined(self, tmp_path):
         """Lists (e.g., previous_sprints as array) are joined with semicolons."""
         f = tmp_path / "lists.json"
@@ -1,5 +1,7 @@
 """Unit tests for scenario input parser (Issue #11)."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from src.scenario.parser import (
@@ -183,11 +185,29 @@ class TestCasePreservation:
         r = parse_scenario("remove Project MyApp-v2")
         assert r.project == "MyApp-v2"
 
+    def test_case_taken_from_matched_span(self):
+        """A name that also appears earlier in the text keeps the matched occurrence's case."""
+        r = parse_scenario("DELAY Delay by 2 weeks")
+        assert r.project == "Delay"
+
+    def test_case_kept_when_lowercasing_changes_length(self):
+        r = parse_scenario("REMOVE İstanbul Hub")
+        assert r.action == ActionType.REMOVE
+        assert r.project == "İstanbul Hub"
+
     def test_stores_original_description(self):
         text = "increase Project Beta budget by 20%"
         r = parse_scenario(text)
         assert r.description == text
 
+    def test_repeat_parse_returns_immutable_action(self):
+        text = "increase Project Beta budget by 20%"
+        first = parse_scenario(text)
+        with pytest.raises(FrozenInstanceError):
+            first.project = "Mutated"
+        assert parse_scenario(text) == first
+        assert hash(parse_scenario(text)) == hash(first)
+
 
 # ──────────────────────────────────────────────
 # Error handling
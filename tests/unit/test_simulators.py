@@ -8,7 +8,7 @@ import pytest
 from src.ingestion.parser import Project, Task, parse_file
 from src.scenario.graph import DependencyGraph, build_dependency_graph
 from src.scenario.parser import ActionType, ScenarioAction
-from src.scenario.simulator import simulate, ScenarioResult, _calc_runway_weeks
+from src.scenario.simulator import simulate, simulate_batch, ScenarioResult, _calc_runway_weeks
 
 SAMPLE_CSV = Path(__file__).parent.parent.parent / "sample-data" / "jira-export-sample.csv"
 REF_DATE = date(2026, 2, 19)
@@ -283,6 +283,49 @@ class TestSimulatorEdgeCases:
         result = simulate(action, projects, graph, REF_DATE)
         assert result.before_state["Beta"]["budget"] == 150_000
 
+    def test_after_state_only_copies_changed_projects(self):
+        projects = _make_projects()
+        graph = _make_graph(projects)
+        action = ScenarioAction(action=ActionType.REMOVE, project="Beta")
+        result = simulate(action, projects, graph, REF_DATE)
+        assert result.before_state["Beta"]["status"] == "Planning"
+        assert result.after_state["Beta"] is not result.before_state["Beta"]
+        assert result.after_state["Gamma"] is result.before_state["Gamma"]
+
+
+# ──────────────────────────────────────────────
+# Batch simulation
+# ──────────────────────────────────────────────
+
+
+class TestSimulateBatch:
+
+    @pytest.fixture()
+    def actions(self) -> list[ScenarioAction]:
+        return [
+            ScenarioAction(action=ActionType.BUDGET_DECREASE, project="Beta", amount=pct)
+            for pct in (0.10, 0.20, 0.30)
+        ] + [ScenarioAction(action=ActionType.DELAY, project="Beta", duration_weeks=4)]
+
+    def test_matches_individual_runs(self, actions):
+        projects = _make_projects()
+        graph = _make_graph(projects)
+        results = simulate_batch(actions, projects, graph, REF_DATE)
+        assert [r.to_dict() for r in results] == [
+            simulate(a, projects, graph, REF_DATE).to_dict() for a in actions
+        ]
+
+    def test_worker_processes_match_in_process(self, actions):
+        projects = _make_projects()
+        graph = _make_graph(projects)
+        parallel = simulate_batch(actions, projects, graph, REF_DATE, max_workers=2)
+        serial = simulate_batch(actions, projects, graph, REF_DATE)
+        assert [r.to_dict() for r in parallel] == [r.to_dict() for r in serial]
+
+    def test_empty_batch(self):
+        projects = _make_projects()
+        assert simulate_batch([], projects, _make_graph(projects), REF_DATE) == []
+
 
 # ──────────────────────────────────────────────
 # Runway helper